@@ -1,5 +1,6 @@
 """Base language detector implementation."""
 
+import functools
 import logging
 import re
 import statistics
@@ -24,6 +25,15 @@ class BaseLanguageDetector(BaseAnalyzer, ABC):
         'nl': {'de', 'het', 'een', 'en', 'van', 'te', 'dat', 'die', 'in', 'is', 'hij', 'niet', 'zijn', 'op', 'aan', 'met', 'als', 'voor', 'had', 'er', 'maar', 'om', 'hem', 'dan', 'zou'}
     }
     
+    # Default size of the exact-match detection cache (0 disables it)
+    DEFAULT_DETECTION_CACHE_SIZE = 2048
+    
+    # Longer texts are not cached, to avoid holding large strings
+    MAX_CACHED_TEXT_LENGTH = 4096
+    
+    # Shorter (stripped) texts are not worth a model call
+    MIN_DETECTABLE_LENGTH = 3
+    
     def __init__(self, config: Optional[dict] = None):
         """Initialize the language detector with configuration."""
         super().__init__(config)
@@ -43,6 +53,20 @@ class BaseLanguageDetector(BaseAnalyzer, ABC):
         
         # Language filtering
         self.restrict_to_supported = self.config.get('restrict_to_supported', True)
+        
+        # Exact-match cache of raw detections for repeated texts
+        cache_size = self.config.get('detection_cache_size', self.DEFAULT_DETECTION_CACHE_SIZE)
+        self._cached_detect = (
+            functools.lru_cache(maxsize=cache_size)(self._detect_language_impl)
+            if cache_size else None
+        )
+        
+        # Settings that determine _preprocess_text() output; detectors with
+        # equal keys can share one preprocessing pass
+        self._preprocess_key = (
+            self.normalize_text, self.remove_urls, self.remove_emails,
+            self.remove_numbers, self.max_text_length,
+        )
     
     @abstractmethod
     def _detect_language_impl(self, text: str) -> Tuple[str, float, List[Tuple[str, float]]]:
@@ -56,11 +80,13 @@ class BaseLanguageDetector(BaseAnalyzer, ABC):
         """
         pass
     
-    def detect_block(self, text: str) -> LanguageDetectionResult:
+    def detect_block(self, text: str, skip_preprocess: bool = False) -> LanguageDetectionResult:
         """Detect language of a text block.
         
         Args:
             text: Text to analyze
+            skip_preprocess: Whether text was already preprocessed by a caller
+                with the same preprocessing settings
             
         Returns:
             Language detection result
@@ -74,7 +100,7 @@ class BaseLanguageDetector(BaseAnalyzer, ABC):
         
         try:
             # Preprocess text
-            processed_text = self._preprocess_text(text)
+            processed_text = text if skip_preprocess else self._preprocess_text(text)
             
             if not processed_text:
                 return LanguageDetectionResult(
@@ -84,21 +110,9 @@ class BaseLanguageDetector(BaseAnalyzer, ABC):
                 )
             
             # Detect language using implementation
-            detected_lang, confidence, alternatives = self._detect_language_impl(processed_text)
-            
-            # Filter alternatives to supported languages if configured
-            if self.restrict_to_supported:
-                alternatives = [(lang, conf) for lang, conf in alternatives 
-                               if lang in self.SUPPORTED_LANGUAGES]
-                
-                if detected_lang not in self.SUPPORTED_LANGUAGES and alternatives:
-                    # Use best supported language
-                    detected_lang, confidence = alternatives[0]
-            
-            # Apply confidence threshold
-            if confidence < self.min_confidence:
-                detected_lang = 'unknown'
-                confidence = 0.0
+            detected_lang, confidence, alternatives = self._apply_language_filters(
+                *self._detect_raw(processed_text)
+            )
             
             return LanguageDetectionResult(
                 detected_language=detected_lang,
@@ -115,6 +129,47 @@ class BaseLanguageDetector(BaseAnalyzer, ABC):
                 method=self.__class__.__name__
             )
     
+    def cleanup(self) -> None:
+        """Cleanup resources and drop cached detections."""
+        if self._cached_detect is not None:
+            self._cached_detect.cache_clear()
+    
+    def _detect_raw(self, text: str) -> Tuple[str, float, List[Tuple[str, float]]]:
+        """Run _detect_language_impl, reusing the result for repeated texts."""
+        if self._cached_detect is not None and len(text) <= self.MAX_CACHED_TEXT_LENGTH:
+            return self._cached_detect(text)
+        return self._detect_language_impl(text)
+    
+    def _is_too_short(self, text: str) -> bool:
+        """Check whether text is too short to classify reliably."""
+        if len(text.strip()) < self.MIN_DETECTABLE_LENGTH:
+            logger.debug(f"Skipping language detection for short text: {text!r}")
+            return True
+        return False
+    
+    def _apply_language_filters(
+        self,
+        detected_lang: str,
+        confidence: float,
+        alternatives: List[Tuple[str, float]]
+    ) -> Tuple[str, float, List[Tuple[str, float]]]:
+        """Apply supported-language restriction and the confidence threshold to a raw detection."""
+        # Filter alternatives to supported languages if configured
+        if self.restrict_to_supported:
+            alternatives = [(lang, conf) for lang, conf in alternatives 
+                           if lang in self.SUPPORTED_LANGUAGES]
+            
+            if detected_lang not in self.SUPPORTED_LANGUAGES and alternatives:
+                # Use best supported language
+                detected_lang, confidence = alternatives[0]
+        
+        # Apply confidence threshold
+        if confidence < self.min_confidence:
+            detected_lang = 'unknown'
+            confidence = 0.0
+        
+        return detected_lang, confidence, alternatives
+    
     def detect_tokens(self, text: str, sample_size: Optional[int] = None) -> List[Tuple[str, LanguageDetectionResult]]:
         """Detect language of individual tokens.
         
@@ -256,11 +311,16 @@ class BaseLanguageDetector(BaseAnalyzer, ABC):
         """Get language hints based on stopwords and character patterns."""
         hints = {}
         
-        # Stopword ratios
-        for lang in self.SUPPORTED_LANGUAGES:
-            ratio = self._calculate_stopword_ratio(text, lang)
-            if ratio > 0:
-                hints[f'{lang}_stopwords'] = ratio
+        # Stopword ratios, from a single tokenization of the text
+        tokens = self._extract_tokens(text)
+        if tokens:
+            for lang in self.SUPPORTED_LANGUAGES:
+                stopwords = self.STOPWORDS.get(lang)
+                if not stopwords:
+                    continue
+                ratio = sum(1 for token in tokens if token in stopwords) / len(tokens)
+                if ratio > 0:
+                    hints[f'{lang}_stopwords'] = ratio
         
         # Character pattern hints
         text_lower = text.lower()
@@ -1,18 +1,33 @@
 """Composite language detector that combines multiple detection methods."""
 
+import heapq
 import logging
-import statistics
-from typing import Dict, List, Optional, Tuple
+from operator import attrgetter, itemgetter
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from transqa.core.language.base import BaseLanguageDetector
-from transqa.core.interfaces import LanguageDetectionResult
+from transqa.core.interfaces import LanguageDetectionError, LanguageDetectionResult
 
 logger = logging.getLogger(__name__)
 
 
+class DetectorOutcome(NamedTuple):
+    """Result of a single component detector, as consumed by the voting methods."""
+    
+    detector: str
+    language: str
+    confidence: float
+    alternatives: List[Tuple[str, float]]
+    weight: float = 1.0
+
+
 class CompositeLanguageDetector(BaseLanguageDetector):
     """Language detector that combines multiple detection methods for better accuracy."""
     
+    # Component detectors cache their own detections, and the composite's
+    # _detect_language_impl records state for get_consensus_threshold()
+    DEFAULT_DETECTION_CACHE_SIZE = 0
+    
     def __init__(self, detectors: List[BaseLanguageDetector], config: Optional[dict] = None):
         """Initialize composite detector with multiple detectors.
         
@@ -26,146 +41,233 @@ class CompositeLanguageDetector(BaseLanguageDetector):
             raise ValueError("At least one detector must be provided")
         
         self.detectors = detectors
+        self._detector_names = [detector.__class__.__name__ for detector in detectors]
+        self._equal_weights = [1.0] * len(detectors)
+        
+        # Text reaching _detect_language_impl is already preprocessed; components
+        # with identical preprocessing settings get it as-is
+        self._skip_preprocess = [
+            detector._preprocess_key == self._preprocess_key for detector in detectors
+        ]
         
         # Composite-specific configuration
         self.voting_method = self.config.get('voting_method', 'weighted')  # 'weighted', 'majority', 'best'
         self.min_detectors = self.config.get('min_detectors', 1)
         self.confidence_threshold = self.config.get('confidence_threshold', 0.3)
         
+        # Tiered initialization: with lazy_init only the first min_detectors
+        # detectors are loaded up front; the rest are loaded the first time a
+        # text is not settled by the detectors before them. A detector whose
+        # confidence reaches early_exit_threshold settles the text (None disables).
+        self.lazy_init = self.config.get('lazy_init', False)
+        self.early_exit_threshold = self.config.get('early_exit_threshold', None)
+        
+        # Voting strategies resolved once instead of per detection
+        self._voting_methods = {
+            'weighted': self._weighted_voting,
+            'majority': self._majority_voting,
+            'best': self._best_confidence_voting,
+        }
+        
         # Detector weights for weighted voting
         self.detector_weights = self.config.get('detector_weights', {})
+        self._refresh_weights()
         
-        # Performance tracking
+        # Performance tracking, sampled on every Nth weighted vote (0 disables)
         self.detector_performance = {}
+        self.perf_tracking_every = self.config.get('perf_tracking_every', 0)
+        self._perf_calls = 0
+        
+        # Outcomes of the most recent detection that ran every detector, keyed
+        # by the preprocessed text, so get_consensus_threshold() can reuse them
+        self._last_results: Optional[Tuple[str, List[DetectorOutcome]]] = None
+        
+        # Per-detector state: None = not loaded yet, True = live, False = failed
+        self._detector_state: List[Optional[bool]] = [None] * len(self.detectors)
     
     def initialize(self) -> None:
-        """Initialize all component detectors."""
+        """Initialize component detectors (eagerly, or up to min_detectors with lazy_init)."""
         super().initialize()
         
         initialized_count = 0
-        for i, detector in enumerate(self.detectors):
-            try:
-                detector.initialize()
+        for i in range(len(self.detectors)):
+            if self.lazy_init and initialized_count >= self.min_detectors:
+                logger.info(f"Deferring initialization of detector {i}: {self._detector_names[i]}")
+                continue
+            if self._initialize_detector(i):
                 initialized_count += 1
-                logger.info(f"Initialized detector {i}: {detector.__class__.__name__}")
-            except Exception as e:
-                logger.warning(f"Failed to initialize detector {i} ({detector.__class__.__name__}): {e}")
         
         if initialized_count < self.min_detectors:
             raise RuntimeError(f"Only {initialized_count} detectors initialized, minimum required: {self.min_detectors}")
         
+        self._refresh_weights()
+        self.is_initialized = True
+        
         logger.info(f"Composite detector initialized with {initialized_count} active detectors")
     
     def cleanup(self) -> None:
         """Cleanup all component detectors."""
         super().cleanup()
         
-        for detector in self.detectors:
+        for detector, detector_name in zip(self.detectors, self._detector_names):
             try:
                 detector.cleanup()
             except Exception as e:
-                logger.warning(f"Error cleaning up detector {detector.__class__.__name__}: {e}")
+                logger.warning(f"Error cleaning up detector {detector_name}: {e}")
+        
+        self._detector_state = [None] * len(self.detectors)
+        self._last_results = None
+        self.is_initialized = False
+    
+    def _ensure_detector(self, index: int) -> bool:
+        """Initialize a deferred component detector on first use.
+        
+        Returns:
+            True if the detector is ready, False if its initialization failed
+            
+        Raises:
+            LanguageDetectionError: If the composite itself is not initialized
+        """
+        state = self._detector_state[index]
+        if state is not None:
+            return state
+        
+        # Deferred detectors only load on behalf of an initialized composite;
+        # after cleanup() the caller has to initialize() again
+        if not self.is_initialized:
+            raise LanguageDetectionError("Composite detector not initialized")
+        
+        return self._initialize_detector(index)
+    
+    def _initialize_detector(self, index: int) -> bool:
+        """Initialize a component detector and record whether it is usable."""
+        detector_name = self._detector_names[index]
+        try:
+            self.detectors[index].initialize()
+            state = True
+            logger.info(f"Initialized detector {index}: {detector_name}")
+        except Exception as e:
+            state = False
+            logger.warning(f"Failed to initialize detector {index} ({detector_name}): {e}")
+        
+        self._detector_state[index] = state
+        return state
     
     def _detect_language_impl(self, text: str) -> Tuple[str, float, List[Tuple[str, float]]]:
         """Detect language using multiple detectors and combine results."""
+        if not self.is_initialized:
+            raise LanguageDetectionError("Composite detector not initialized")
+        
         detector_results = []
+        settled_early = False
+        
+        confidence_threshold = self.confidence_threshold
+        early_exit_threshold = self.early_exit_threshold
         
-        # Get results from all detectors
-        for detector in self.detectors:
+        # Get results from detectors in priority order
+        for i, (detector, detector_name, weight, skip_preprocess) in enumerate(
+            zip(self.detectors, self._detector_names, self._weights, self._skip_preprocess)
+        ):
+            if not self._ensure_detector(i):
+                continue
             try:
-                result = detector.detect_block(text)
-                if result.detected_language != 'unknown':
-                    detector_results.append({
-                        'detector': detector.__class__.__name__,
-                        'language': result.detected_language,
-                        'confidence': result.confidence,
-                        'alternatives': result.alternative_languages or []
-                    })
+                result = detector.detect_block(text, skip_preprocess=skip_preprocess)
+                # Low-confidence results are noise for voting; drop them here
+                if result.detected_language != 'unknown' and result.confidence >= confidence_threshold:
+                    detector_results.append(DetectorOutcome(
+                        detector=detector_name,
+                        language=result.detected_language,
+                        confidence=result.confidence,
+                        alternatives=result.alternative_languages or [],
+                        weight=weight
+                    ))
+                    # A saturated result settles the text; skip the remaining detectors
+                    if early_exit_threshold is not None and result.confidence >= early_exit_threshold:
+                        settled_early = True
+                        break
             except Exception as e:
-                logger.warning(f"Detector {detector.__class__.__name__} failed: {e}")
+                logger.warning(f"Detector {detector_name} failed: {e}")
+        
+        # An early exit leaves out the remaining detectors, so its outcomes
+        # are not a consensus sample
+        self._last_results = None if settled_early else (text, detector_results)
         
         if not detector_results:
             return 'unknown', 0.0, []
         
         # Combine results based on voting method
-        if self.voting_method == 'weighted':
-            return self._weighted_voting(detector_results)
-        elif self.voting_method == 'majority':
-            return self._majority_voting(detector_results)
-        elif self.voting_method == 'best':
-            return self._best_confidence_voting(detector_results)
-        else:
+        vote = self._voting_methods.get(self.voting_method)
+        if vote is None:
             raise ValueError(f"Unknown voting method: {self.voting_method}")
+        return vote(detector_results)
     
-    def _weighted_voting(self, results: List[dict]) -> Tuple[str, float, List[Tuple[str, float]]]:
+    def _weighted_voting(self, results: List[DetectorOutcome]) -> Tuple[str, float, List[Tuple[str, float]]]:
         """Combine results using weighted voting."""
+        # language -> [weighted score, weight, votes]
         language_scores = {}
-        total_weight = 0
+        update_performance = self._update_performance_tracking
+        track_performance = self._should_track_performance()
         
-        for result in results:
-            detector_name = result['detector']
-            language = result['language']
-            confidence = result['confidence']
-            
-            # Get weight for this detector
-            weight = self.detector_weights.get(detector_name, 1.0)
-            
+        for detector_name, language, confidence, _, weight in results:
             # Update performance tracking
-            self._update_performance_tracking(detector_name, confidence)
-            
-            # Add weighted score
-            weighted_score = confidence * weight
+            if track_performance:
+                update_performance(detector_name, confidence)
             
-            if language not in language_scores:
-                language_scores[language] = {'score': 0, 'weight': 0, 'votes': 0}
+            entry = language_scores.get(language)
+            if entry is None:
+                entry = language_scores[language] = [0.0, 0.0, 0]
             
-            language_scores[language]['score'] += weighted_score
-            language_scores[language]['weight'] += weight
-            language_scores[language]['votes'] += 1
-            total_weight += weight
+            # Add weighted score
+            entry[0] += confidence * weight
+            entry[1] += weight
+            entry[2] += 1
         
         if not language_scores:
             return 'unknown', 0.0, []
         
-        # Calculate final scores
+        # Calculate final scores; each vote is worth a fixed share of the
+        # 0.1 consensus boost, so the division is done once per call
+        boost_per_vote = 0.1 / len(results)
         final_scores = []
-        for lang, data in language_scores.items():
-            if data['weight'] > 0:
+        for lang, (score, weight, votes) in language_scores.items():
+            if weight > 0:
                 # Average weighted confidence
-                avg_confidence = data['score'] / data['weight']
+                avg_confidence = score / weight
                 # Boost score based on number of votes (consensus)
-                consensus_boost = min(data['votes'] / len(results), 1.0) * 0.1
+                consensus_boost = votes * boost_per_vote
                 final_score = min(avg_confidence + consensus_boost, 1.0)
                 final_scores.append((lang, final_score))
         
-        # Sort by score
-        final_scores.sort(key=lambda x: x[1], reverse=True)
-        
         if not final_scores:
             return 'unknown', 0.0, []
         
-        primary_lang, primary_score = final_scores[0]
-        alternatives = final_scores[1:5]  # Top 4 alternatives
+        # Only the primary and top 4 alternatives are used
+        top_scores = heapq.nlargest(5, final_scores, key=itemgetter(1))
+        primary_lang, primary_score = top_scores[0]
+        alternatives = top_scores[1:]
         
         return primary_lang, primary_score, alternatives
     
-    def _majority_voting(self, results: List[dict]) -> Tuple[str, float, List[Tuple[str, float]]]:
+    def _majority_voting(self, results: List[DetectorOutcome]) -> Tuple[str, float, List[Tuple[str, float]]]:
         """Combine results using majority voting."""
         language_votes = {}
         
         for result in results:
-            language = result['language']
-            confidence = result['confidence']
-            
-            if language not in language_votes:
-                language_votes[language] = {'votes': 0, 'confidences': []}
+            data = language_votes.get(result.language)
+            if data is None:
+                data = language_votes[result.language] = {'votes': 0, 'confidences': []}
             
-            language_votes[language]['votes'] += 1
-            language_votes[language]['confidences'].append(confidence)
+            data['votes'] += 1
+            data['confidences'].append(result.confidence)
         
         if not language_votes:
             return 'unknown', 0.0, []
         
+        # Average each language's confidences once; they are reused below
+        for data in language_votes.values():
+            confidences = data['confidences']
+            data['avg'] = sum(confidences) / len(confidences)
+        
         # Find language(s) with most votes
         max_votes = max(data['votes'] for data in language_votes.values())
         winners = [(lang, data) for lang, data in language_votes.items() 
@@ -174,13 +276,13 @@ class CompositeLanguageDetector(BaseLanguageDetector):
         if len(winners) == 1:
             # Clear winner
             lang, data = winners[0]
-            avg_confidence = statistics.mean(data['confidences'])
+            avg_confidence = data['avg']
             
             # Create alternatives from other languages
             alternatives = []
             for other_lang, other_data in language_votes.items():
                 if other_lang != lang:
-                    other_conf = statistics.mean(other_data['confidences'])
+                    other_conf = other_data['avg']
                     alternatives.append((other_lang, other_conf))
             
             alternatives.sort(key=lambda x: x[1], reverse=True)
@@ -192,7 +294,7 @@ class CompositeLanguageDetector(BaseLanguageDetector):
             best_confidence = 0
             
             for lang, data in winners:
-                avg_conf = statistics.mean(data['confidences'])
+                avg_conf = data['avg']
                 if avg_conf > best_confidence:
                     best_confidence = avg_conf
                     best_lang = lang
@@ -201,42 +303,49 @@ class CompositeLanguageDetector(BaseLanguageDetector):
             alternatives = []
             for lang, data in language_votes.items():
                 if lang != best_lang:
-                    avg_conf = statistics.mean(data['confidences'])
+                    avg_conf = data['avg']
                     alternatives.append((lang, avg_conf))
             
             alternatives.sort(key=lambda x: x[1], reverse=True)
             return best_lang, best_confidence, alternatives[:3]
     
-    def _best_confidence_voting(self, results: List[dict]) -> Tuple[str, float, List[Tuple[str, float]]]:
+    def _best_confidence_voting(self, results: List[DetectorOutcome]) -> Tuple[str, float, List[Tuple[str, float]]]:
         """Use result from detector with highest confidence."""
         if not results:
             return 'unknown', 0.0, []
         
-        # Sort by confidence
-        results.sort(key=lambda x: x['confidence'], reverse=True)
-        best_result = results[0]
+        # Pick the most confident result without reordering the caller's list
+        best_result = max(results, key=attrgetter('confidence'))
         
         # Collect alternatives from all detectors
         all_alternatives = {}
         
         for result in results:
             # Add primary detection as alternative if not the best
-            if result != best_result:
-                lang = result['language']
-                conf = result['confidence']
+            if result is not best_result:
+                lang = result.language
+                conf = result.confidence
                 if lang not in all_alternatives or all_alternatives[lang] < conf:
                     all_alternatives[lang] = conf
             
             # Add detector's alternatives
-            for alt_lang, alt_conf in result['alternatives']:
+            for alt_lang, alt_conf in result.alternatives:
                 if alt_lang not in all_alternatives or all_alternatives[alt_lang] < alt_conf:
                     all_alternatives[alt_lang] = alt_conf
         
-        # Convert to list and sort
-        alternatives = list(all_alternatives.items())
-        alternatives.sort(key=lambda x: x[1], reverse=True)
+        # Keep only the top 3 alternatives
+        alternatives = heapq.nlargest(3, all_alternatives.items(), key=itemgetter(1))
         
-        return best_result['language'], best_result['confidence'], alternatives[:3]
+        return best_result.language, best_result.confidence, alternatives
+    
+    def _should_track_performance(self) -> bool:
+        """Decide whether the current vote is sampled for performance tracking."""
+        every = self.perf_tracking_every
+        if not every:
+            return False
+        
+        self._perf_calls += 1
+        return self._perf_calls % every == 0
     
     def _update_performance_tracking(self, detector_name: str, confidence: float) -> None:
         """Update performance tracking for a detector."""
@@ -252,14 +361,25 @@ class CompositeLanguageDetector(BaseLanguageDetector):
         perf['confidence_sum'] += confidence
         perf['avg_confidence'] = perf['confidence_sum'] / perf['total_detections']
     
+    def _refresh_weights(self) -> None:
+        """Resolve the voting weight of each detector, in detector order."""
+        if not self.detector_weights:
+            # Unweighted ensemble: share one precomputed equal-weight vector
+            self._weights = self._equal_weights
+            return
+        
+        self._weights = [
+            self.detector_weights.get(detector_name, 1.0)
+            for detector_name in self._detector_names
+        ]
+    
     def get_detector_stats(self) -> Dict[str, dict]:
         """Get performance statistics for each detector."""
         stats = {}
         
-        for detector in self.detectors:
-            detector_name = detector.__class__.__name__
+        for detector, detector_name in zip(self.detectors, self._detector_names):
             stats[detector_name] = {
-                'initialized': getattr(detector, '_initialized', False) or getattr(detector, 'is_initialized', False),
+                'initialized': detector.is_initialized,
                 'weight': self.detector_weights.get(detector_name, 1.0),
                 'performance': self.detector_performance.get(detector_name, {})
             }
@@ -277,21 +397,34 @@ class CompositeLanguageDetector(BaseLanguageDetector):
         """Get consensus score for a text across all detectors."""
         detector_results = []
         
-        for detector in self.detectors:
-            try:
-                result = detector.detect_block(text)
-                if result.detected_language != 'unknown':
-                    detector_results.append(result.detected_language)
-            except Exception:
-                continue
+        # Reuse the outcomes of a preceding detect_block() on the same text
+        last_results = self._last_results
+        if last_results is not None and last_results[0] == self._preprocess_text(text):
+            detector_results = [outcome.language for outcome in last_results[1]]
+        else:
+            for i, detector in enumerate(self.detectors):
+                # Load deferred detectors so none silently drops out of the count
+                if not self._ensure_detector(i):
+                    continue
+                try:
+                    result = detector.detect_block(text)
+                    if (result.detected_language != 'unknown'
+                            and result.confidence >= self.confidence_threshold):
+                        detector_results.append(result.detected_language)
+                except Exception:
+                    continue
         
         if not detector_results:
             return 0.0
         
         # Calculate consensus as percentage of detectors agreeing on most common language
-        from collections import Counter
-        lang_counts = Counter(detector_results)
-        most_common_count = lang_counts.most_common(1)[0][1]
+        lang_counts = {}
+        most_common_count = 0
+        for lang in detector_results:
+            count = lang_counts.get(lang, 0) + 1
+            lang_counts[lang] = count
+            if count > most_common_count:
+                most_common_count = count
         
         consensus = most_common_count / len(detector_results)
         return consensus
@@ -307,4 +440,5 @@ class CompositeLanguageDetector(BaseLanguageDetector):
             weight = max(0.1, min(2.0, performance_score * 2))  # Weight range: 0.1 to 2.0
             self.detector_weights[detector_name] = weight
         
+        self._refresh_weights()
         logger.info(f"Updated detector weights: {self.detector_weights}")
@@ -1,6 +1,9 @@
 """Factory for creating language detector instances."""
 
+import functools
 import logging
+from time import perf_counter_ns
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 from transqa.core.language.base import BaseLanguageDetector
@@ -9,7 +12,42 @@ from transqa.core.interfaces import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
-# Lazy imports to handle optional dependencies
+# Static parts of the detector configuration built by create_from_config();
+# only the application-dependent fields are filled in per call
+_DETECTOR_CONFIG_TEMPLATE = MappingProxyType({
+    'min_confidence': 0.5,
+    'min_text_length': 20,
+    'max_text_length': 10000,
+    'normalize_text': True,
+    'remove_urls': True,
+    'remove_emails': True,
+    'restrict_to_supported': True,
+})
+
+_FASTTEXT_CONFIG_TEMPLATE = MappingProxyType({
+    **_DETECTOR_CONFIG_TEMPLATE,
+    'auto_download': True,
+    'k': 5,
+    'threshold': 0.0,
+})
+
+_LANGID_CONFIG_TEMPLATE = MappingProxyType({
+    **_DETECTOR_CONFIG_TEMPLATE,
+    'restrict_languages': True,
+    'normalize_scores': True,
+})
+
+_COMPOSITE_CONFIG_TEMPLATE = MappingProxyType({
+    'voting_method': 'weighted',
+    'min_detectors': 1,
+    'confidence_threshold': 0.3,
+    'lazy_init': True,
+    'early_exit_threshold': 0.95,
+})
+
+# Lazy imports to handle optional dependencies; availability cannot change
+# within a process, so each import is attempted only once
+@functools.cache
 def _get_fasttext_detector():
     """Lazy import of FastTextDetector to handle optional dependency."""
     try:
@@ -18,6 +56,7 @@ def _get_fasttext_detector():
     except ImportError:
         return None
 
+@functools.cache
 def _get_langid_detector():
     """Lazy import of LangIDDetector to handle optional dependency."""
     try:
@@ -154,43 +193,21 @@ class LanguageDetectorFactory:
         Returns:
             Configured language detector instance
         """
-        # Extract language detection configuration
-        detector_config = {
-            'min_confidence': 0.5,
-            'min_text_length': 20,
-            'max_text_length': 10000,
-            'sample_size': app_config.rules.max_sample_tokens,
-            'normalize_text': True,
-            'remove_urls': True,
-            'remove_emails': True,
-            'restrict_to_supported': True,
-        }
+        sample_size = app_config.rules.max_sample_tokens
         
-        # FastText specific config
-        fasttext_config = detector_config.copy()
-        fasttext_config.update({
-            'models_dir': str(app_config.get_models_dir()),
-            'auto_download': True,
-            'k': 5,
-            'threshold': 0.0,
-        })
-        
-        # LangID specific config
-        langid_config = detector_config.copy()
-        langid_config.update({
-            'restrict_languages': True,
-            'normalize_scores': True,
-        })
-        
-        # Composite config combining both
+        # Composite config combining both detectors; the templates are copied
+        # because detectors keep (and may update) the dicts they are given
         composite_config = {
-            'fasttext': fasttext_config,
-            'langid': langid_config,
-            'composite': {
-                'voting_method': 'weighted',
-                'min_detectors': 1,
-                'confidence_threshold': 0.3,
-            }
+            'fasttext': {
+                **_FASTTEXT_CONFIG_TEMPLATE,
+                'sample_size': sample_size,
+                'models_dir': str(app_config.get_models_dir()),
+            },
+            'langid': {
+                **_LANGID_CONFIG_TEMPLATE,
+                'sample_size': sample_size,
+            },
+            'composite': dict(_COMPOSITE_CONFIG_TEMPLATE),
         }
         
         return LanguageDetectorFactory.create_detector('auto', composite_config)
@@ -380,31 +397,34 @@ class LanguageDetectorFactory:
                 
                 correct_predictions = 0
                 total_confidence = 0
-                total_time = 0
+                times_ns = [0] * len(test_texts)
                 
-                import time
-                
-                for text, expected_lang in zip(test_texts, expected_languages):
-                    start_time = time.time()
+                for i, (text, expected_lang) in enumerate(zip(test_texts, expected_languages)):
+                    start_ns = perf_counter_ns()
                     result = detector.detect_block(text)
-                    end_time = time.time()
+                    times_ns[i] = perf_counter_ns() - start_ns
                     
                     if result.detected_language == expected_lang:
                         correct_predictions += 1
                     
                     total_confidence += result.confidence
-                    total_time += (end_time - start_time)
                 
                 detector.cleanup()
                 
                 accuracy = correct_predictions / len(test_texts)
                 avg_confidence = total_confidence / len(test_texts)
-                avg_time = total_time / len(test_texts)
+                avg_time = sum(times_ns) / len(times_ns) / 1e9
+                
+                times_ns.sort()
+                p50_time = times_ns[(len(times_ns) - 1) // 2] / 1e9
+                p95_time = times_ns[int(0.95 * (len(times_ns) - 1))] / 1e9
                 
                 results[detector_type] = {
                     'accuracy': accuracy,
                     'avg_confidence': avg_confidence,
                     'avg_time_seconds': avg_time,
+                    'p50_time_seconds': p50_time,
+                    'p95_time_seconds': p95_time,
                     'total_tests': len(test_texts),
                     'correct_predictions': correct_predictions,
                 }
@@ -1,16 +1,45 @@
 """FastText-based language detector."""
 
+import itertools
 import logging
 import os
-import urllib.request
+import re
+import shutil
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
 
 from transqa.core.language.base import BaseLanguageDetector
 from transqa.core.interfaces import LanguageDetectionError
 
 logger = logging.getLogger(__name__)
 
+# FastText expects single-line input; any whitespace run becomes one space
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Map some common label variations to our supported languages
+_LANGUAGE_CODE_MAP = MappingProxyType({
+    'es': 'es',
+    'spa': 'es',  # Spanish ISO 639-2
+    'en': 'en',
+    'eng': 'en',  # English ISO 639-2
+    'nl': 'nl',
+    'nld': 'nl',  # Dutch ISO 639-2
+    'dut': 'nl',  # Dutch alternative code
+})
+
+# Copy buffer for the model download and interval between progress reports
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_PROGRESS_INTERVAL = 5.0
+
+# Attempts (with exponential backoff) and per-request timeout for the download
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_TIMEOUT = 30
+
 try:
     import fasttext
     FASTTEXT_AVAILABLE = True
@@ -26,6 +55,11 @@ class FastTextDetector(BaseLanguageDetector):
     LID_MODEL_URL = "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.bin"
     LID_MODEL_FILENAME = "lid.176.bin"
     
+    # Loaded models and their parsed label tables, shared by every instance
+    # using the same model file
+    _MODEL_CACHE: Dict[str, Tuple[Any, Dict[str, Optional[str]]]] = {}
+    _MODEL_LOCK = threading.Lock()
+    
     def __init__(self, config: Optional[dict] = None):
         """Initialize FastText detector."""
         if not FASTTEXT_AVAILABLE:
@@ -41,10 +75,14 @@ class FastTextDetector(BaseLanguageDetector):
         self.auto_download = self.config.get('auto_download', True)
         self.k = self.config.get('k', 5)  # Number of predictions to return
         self.threshold = self.config.get('threshold', 0.0)  # Minimum threshold for predictions
+        self.prefetch = self.config.get('prefetch', True)  # Hint the OS to read the model ahead
         
         # Model instance
         self._model = None
         self._model_loaded = False
+        
+        # FastText label -> language code, filled from the model vocabulary on load
+        self._label_cache: Dict[str, Optional[str]] = {}
     
     def initialize(self) -> None:
         """Initialize the FastText model."""
@@ -53,23 +91,29 @@ class FastTextDetector(BaseLanguageDetector):
         if not self._model_loaded:
             self._load_model()
             self._model_loaded = True
+        self.is_initialized = True
     
     def cleanup(self) -> None:
         """Cleanup resources."""
         super().cleanup()
         if self._model:
-            # FastText models don't need explicit cleanup
+            # The model stays in the shared cache; only drop this reference
             self._model = None
+        self._label_cache = {}
         self._model_loaded = False
+        self.is_initialized = False
     
     def _detect_language_impl(self, text: str) -> Tuple[str, float, List[Tuple[str, float]]]:
         """Detect language using FastText LID model."""
+        if self._is_too_short(text):
+            return 'unknown', 0.0, []
+        
         if not self._model:
             raise LanguageDetectionError("FastText model not loaded")
         
         try:
             # FastText expects single line input without newlines
-            text_clean = text.replace('\n', ' ').strip()
+            text_clean = _WHITESPACE_RE.sub(' ', text).strip()
             
             if not text_clean:
                 return 'unknown', 0.0, []
@@ -77,35 +121,88 @@ class FastTextDetector(BaseLanguageDetector):
             # Predict language
             predictions = self._model.predict(text_clean, k=self.k, threshold=self.threshold)
             
-            if not predictions[0]:  # No predictions
-                return 'unknown', 0.0, []
-            
-            # Parse results
-            languages = predictions[0]  # List of language labels
-            confidences = predictions[1]  # List of confidence scores
-            
-            # Convert FastText labels (e.g., '__label__en') to language codes
-            results = []
-            for lang_label, confidence in zip(languages, confidences):
-                lang_code = self._parse_fasttext_label(lang_label)
-                if lang_code:
-                    results.append((lang_code, float(confidence)))
-            
-            if not results:
-                return 'unknown', 0.0, []
-            
-            # Primary result
-            primary_lang, primary_confidence = results[0]
-            
-            # Alternatives (excluding the primary)
-            alternatives = results[1:] if len(results) > 1 else []
-            
-            return primary_lang, primary_confidence, alternatives
+            # Parse results: list of language labels, list of confidence scores
+            return self._parse_predictions(predictions[0], predictions[1])
         
         except Exception as e:
             logger.error(f"FastText detection error: {e}")
             return 'unknown', 0.0, []
     
+    def _parse_predictions(self, languages, confidences) -> Tuple[str, float, List[Tuple[str, float]]]:
+        """Convert one FastText prediction (labels, scores) into a detection tuple."""
+        # FastText returns scores as a NumPy array; convert them to Python
+        # floats in one call rather than one float() per label
+        if hasattr(confidences, 'tolist'):
+            confidences = confidences.tolist()
+        
+        # Convert FastText labels (e.g., '__label__en') to language codes,
+        # dropping labels that don't map to one
+        label_cache = self._label_cache
+        parse_label = self._parse_fasttext_label
+        results = (
+            (lang_code, confidence)
+            for lang_code, confidence in (
+                (label_cache.get(label) or parse_label(label), confidence)
+                for label, confidence in zip(languages, confidences)
+            )
+            if lang_code
+        )
+        
+        # Primary result
+        primary = next(results, None)
+        if primary is None:
+            return 'unknown', 0.0, []
+        
+        # Alternatives (excluding the primary)
+        alternatives = list(itertools.islice(results, max(self.k - 1, 0)))
+        
+        return primary[0], primary[1], alternatives
+    
+    def batch_detect(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """Detect language for multiple texts with a single model call.
+        
+        Applies the same length check, preprocessing and filtering as
+        detect_block(), but hands all eligible texts to FastText at once.
+        
+        Args:
+            texts: List of texts to analyze
+            
+        Returns:
+            List of (language, confidence) tuples, in input order
+        """
+        if not self._model:
+            raise LanguageDetectionError("FastText model not loaded")
+        
+        results = [('unknown', 0.0)] * len(texts)
+        
+        # Preprocess eligible texts, remembering where each one came from
+        indices = []
+        batch = []
+        for i, text in enumerate(texts):
+            if not text or len(text.strip()) < self.min_text_length:
+                continue
+            text_clean = _WHITESPACE_RE.sub(' ', self._preprocess_text(text)).strip()
+            if text_clean:
+                indices.append(i)
+                batch.append(text_clean)
+        
+        if not batch:
+            return results
+        
+        try:
+            all_labels, all_confidences = self._model.predict(batch, k=self.k, threshold=self.threshold)
+        except Exception as e:
+            logger.warning(f"FastText batch detection failed: {e}")
+            return results
+        
+        for i, labels, confidences in zip(indices, all_labels, all_confidences):
+            detected_lang, confidence, _ = self._apply_language_filters(
+                *self._parse_predictions(labels, confidences)
+            )
+            results[i] = (detected_lang, confidence)
+        
+        return results
+    
     def _parse_fasttext_label(self, label: str) -> Optional[str]:
         """Parse FastText language label to language code."""
         if not label.startswith('__label__'):
@@ -114,44 +211,77 @@ class FastTextDetector(BaseLanguageDetector):
         # Extract language code (e.g., '__label__en' -> 'en')
         lang_code = label[9:]  # Remove '__label__' prefix
         
-        # Map some common variations to our supported languages
-        lang_mapping = {
-            'es': 'es',
-            'spa': 'es',  # Spanish ISO 639-2
-            'en': 'en', 
-            'eng': 'en',  # English ISO 639-2
-            'nl': 'nl',
-            'nld': 'nl',  # Dutch ISO 639-2
-            'dut': 'nl',  # Dutch alternative code
-        }
+        # LID labels are already lowercase; only lowercase unexpected ones
+        mapped = _LANGUAGE_CODE_MAP.get(lang_code)
+        if mapped is not None:
+            return mapped
         
-        return lang_mapping.get(lang_code.lower(), lang_code.lower())
+        lang_code = lang_code.lower()
+        return _LANGUAGE_CODE_MAP.get(lang_code, lang_code)
     
     def _load_model(self) -> None:
         """Load the FastText LID model."""
         try:
             # Determine model path
             model_path = self._get_model_path()
+            cache_key = str(model_path.resolve())
             
-            # Download model if needed and auto_download is enabled
-            if not model_path.exists() and self.auto_download:
-                logger.info(f"FastText LID model not found. Downloading to {model_path}...")
-                self._download_model(model_path)
-            
-            if not model_path.exists():
-                raise LanguageDetectionError(
-                    f"FastText LID model not found at {model_path}. "
-                    f"Set auto_download=True or download manually from {self.LID_MODEL_URL}"
-                )
-            
-            # Load model
-            logger.info(f"Loading FastText LID model from {model_path}...")
-            self._model = fasttext.load_model(str(model_path))
-            logger.info("FastText LID model loaded successfully")
+            # Held across download and load so concurrent instances wait for
+            # the first one instead of fetching the model twice
+            with self._MODEL_LOCK:
+                cached = self._MODEL_CACHE.get(cache_key)
+                if cached is not None:
+                    self._model, self._label_cache = cached
+                    logger.info(f"Reusing loaded FastText LID model from {model_path}")
+                    return
+                
+                # Download model if needed and auto_download is enabled
+                if not model_path.exists() and self.auto_download:
+                    logger.info(f"FastText LID model not found. Downloading to {model_path}...")
+                    self._download_model(model_path)
+                
+                if not model_path.exists():
+                    raise LanguageDetectionError(
+                        f"FastText LID model not found at {model_path}. "
+                        f"Set auto_download=True or download manually from {self.LID_MODEL_URL}"
+                    )
+                
+                # Load model
+                logger.info(f"Loading FastText LID model from {model_path}...")
+                if self.prefetch:
+                    self._prefetch_model_file(model_path)
+                self._model = fasttext.load_model(str(model_path))
+                
+                # The label vocabulary is fixed, so parse every label once up front
+                self._label_cache = {
+                    label: self._parse_fasttext_label(label)
+                    for label in self._model.get_labels()
+                }
+                self._MODEL_CACHE[cache_key] = (self._model, self._label_cache)
+                logger.info("FastText LID model loaded successfully")
         
         except Exception as e:
             raise LanguageDetectionError(f"Failed to load FastText model: {e}")
     
+    @staticmethod
+    def _prefetch_model_file(model_path: Path) -> None:
+        """Ask the kernel to start reading the model into the page cache.
+        
+        Only a hint: a no-op where posix_fadvise is unavailable, and errors
+        are ignored since load_model() reads the file either way.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        
+        try:
+            fd = os.open(str(model_path), os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug(f"Model prefetch hint failed: {e}")
+    
     def _get_model_path(self) -> Path:
         """Get the path to the FastText LID model."""
         if self.model_path:
@@ -173,43 +303,118 @@ class FastTextDetector(BaseLanguageDetector):
         return models_dir / self.LID_MODEL_FILENAME
     
     def _download_model(self, target_path: Path) -> None:
-        """Download the FastText LID model."""
+        """Download the FastText LID model, resuming interrupted transfers."""
+        part_path = target_path.with_suffix(target_path.suffix + '.part')
         try:
             target_path.parent.mkdir(parents=True, exist_ok=True)
             
             logger.info(f"Downloading FastText LID model from {self.LID_MODEL_URL}...")
             
-            # Download with progress (simple version)
-            def progress_hook(block_num, block_size, total_size):
-                if total_size > 0:
-                    downloaded = block_num * block_size
-                    percent = min(100, (downloaded * 100) // total_size)
-                    if block_num % 1000 == 0:  # Log every ~1000 blocks to avoid spam
-                        logger.info(f"Download progress: {percent}% ({downloaded}/{total_size} bytes)")
-            
-            urllib.request.urlretrieve(
-                self.LID_MODEL_URL, 
-                str(target_path),
-                reporthook=progress_hook
-            )
-            
-            logger.info(f"FastText LID model downloaded successfully: {target_path}")
+            for attempt in range(1, DOWNLOAD_RETRIES + 1):
+                try:
+                    self._fetch_model_part(part_path)
+                    break
+                except (requests.RequestException, OSError) as e:
+                    if attempt == DOWNLOAD_RETRIES:
+                        raise
+                    delay = 2 ** attempt
+                    logger.warning(
+                        f"Model download attempt {attempt}/{DOWNLOAD_RETRIES} failed: {e}. "
+                        f"Resuming in {delay}s..."
+                    )
+                    time.sleep(delay)
             
             # Verify file size (LID model should be around 126MB)
-            file_size = target_path.stat().st_size
+            file_size = part_path.stat().st_size
             if file_size < 1_000_000:  # Less than 1MB suggests incomplete download
-                target_path.unlink()  # Delete incomplete file
                 raise LanguageDetectionError(
                     f"Downloaded file appears incomplete (size: {file_size} bytes)"
                 )
             
+            # Only a complete download ever appears under the final name
+            os.replace(part_path, target_path)
+            
+            logger.info(f"FastText LID model downloaded successfully: {target_path}")
             logger.info(f"Model file size: {file_size / 1_000_000:.1f} MB")
         
         except Exception as e:
-            if target_path.exists():
-                target_path.unlink()  # Clean up incomplete download
+            if part_path.exists():
+                part_path.unlink()  # Clean up incomplete download
             raise LanguageDetectionError(f"Failed to download FastText model: {e}")
     
+    def _fetch_model_part(self, part_path: Path) -> None:
+        """Download the model into part_path, continuing from any bytes already there."""
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        headers = {'Range': f'bytes={offset}-'} if offset else {}
+        
+        with requests.get(
+            self.LID_MODEL_URL, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT
+        ) as response:
+            if offset and response.status_code == 416:
+                # Range starts past the end: the previous attempt got everything
+                return
+            response.raise_for_status()
+            
+            if offset and response.status_code != 206:
+                # Server ignored the Range header and sent the whole file
+                logger.info("Server does not support resuming; restarting model download")
+                offset = 0
+            elif offset:
+                logger.info(f"Resuming model download at {offset} bytes")
+            
+            total_size = int(response.headers.get('Content-Length') or 0)
+            if total_size:
+                total_size += offset
+            
+            response.raw.decode_content = True
+            with open(part_path, 'ab' if offset else 'wb') as f:
+                # Progress is polled from the file size on a side thread so
+                # the copy loop stays inside shutil's C-level read/write
+                done = threading.Event()
+                reporter = threading.Thread(
+                    target=self._report_download_progress,
+                    args=(part_path, total_size, done),
+                    daemon=True,
+                )
+                reporter.start()
+                try:
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                finally:
+                    done.set()
+                    reporter.join()
+                
+                # Make the data durable before the rename publishes it
+                f.flush()
+                os.fsync(f.fileno())
+            
+            if total_size and part_path.stat().st_size < total_size:
+                raise OSError(
+                    f"Connection closed after {part_path.stat().st_size} of {total_size} bytes"
+                )
+    
+    @classmethod
+    def unload_all(cls) -> None:
+        """Release all shared models (e.g. at shutdown).
+        
+        Instances that are still initialized keep their own reference.
+        """
+        with cls._MODEL_LOCK:
+            cls._MODEL_CACHE.clear()
+    
+    @staticmethod
+    def _report_download_progress(part_path: Path, total_size: int, done: threading.Event) -> None:
+        """Log download progress periodically until done is set."""
+        while not done.wait(DOWNLOAD_PROGRESS_INTERVAL):
+            try:
+                downloaded = part_path.stat().st_size
+            except OSError:
+                continue
+            if total_size > 0:
+                percent = min(100, (downloaded * 100) // total_size)
+                logger.info(f"Download progress: {percent}% ({downloaded}/{total_size} bytes)")
+            else:
+                logger.info(f"Download progress: {downloaded} bytes")
+    
     @staticmethod
     def check_availability() -> dict:
         """Check if FastText is available and model status."""
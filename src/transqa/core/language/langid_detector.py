@@ -1,7 +1,11 @@
 """LangID-based language detector as fallback."""
 
+import functools
+import heapq
 import logging
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 
 from transqa.core.language.base import BaseLanguageDetector
 from transqa.core.interfaces import LanguageDetectionError
@@ -16,6 +20,18 @@ except ImportError:
     langid = None
 
 
+# The langid model is large; detectors with the same language filter share
+# one probability-normalized identifier per process
+@functools.cache
+def _get_normalized_identifier(languages: Optional[Tuple[str, ...]]):
+    """Build a langid identifier whose confidences are 0-1 probabilities."""
+    from langid.langid import LanguageIdentifier, model
+    identifier = LanguageIdentifier.from_modelstring(model, norm_probs=True)
+    if languages:
+        identifier.set_languages(list(languages))
+    return identifier
+
+
 class LangIDDetector(BaseLanguageDetector):
     """Language detector using langid.py library."""
     
@@ -32,9 +48,25 @@ class LangIDDetector(BaseLanguageDetector):
         self.restrict_languages = self.config.get('restrict_languages', True)
         self.normalize_scores = self.config.get('normalize_scores', True)
         
+        # Parallel batch detection (max_workers=None lets the executor decide)
+        self.max_workers = self.config.get('max_workers', None)
+        self.parallel_batch_min = self.config.get('parallel_batch_min', 8)
+        
         # LangID instance
         self._identifier = None
         self._initialized = False
+        
+        # (language, stopword hint key, character hint key) for every
+        # supported language, so scoring doesn't format keys per call
+        self._hint_keys = tuple(
+            (lang, f'{lang}_stopwords', f'{lang}_chars')
+            for lang in self.SUPPORTED_LANGUAGES
+        )
+        
+        # Hints depend only on the text; memoize them for repeated blocks
+        self._language_hints = functools.lru_cache(maxsize=self.config.get('hints_cache_size', 4096))(
+            self._get_language_hints
+        )
     
     def initialize(self) -> None:
         """Initialize the langid detector."""
@@ -43,15 +75,21 @@ class LangIDDetector(BaseLanguageDetector):
         if not self._initialized:
             self._setup_langid()
             self._initialized = True
+        self.is_initialized = True
     
     def cleanup(self) -> None:
         """Cleanup resources."""
         super().cleanup()
         self._identifier = None
         self._initialized = False
+        self.is_initialized = False
+        self._language_hints.cache_clear()
     
     def _detect_language_impl(self, text: str) -> Tuple[str, float, List[Tuple[str, float]]]:
         """Detect language using langid.py."""
+        if self._is_too_short(text):
+            return 'unknown', 0.0, []
+        
         if not self._identifier:
             raise LanguageDetectionError("LangID not initialized")
         
@@ -59,29 +97,25 @@ class LangIDDetector(BaseLanguageDetector):
             # Classify text
             lang_code, confidence = self._identifier.classify(text)
             
-            # langid.py only returns the top prediction, so we'll create alternatives
-            # based on confidence scores if available
-            alternatives = []
+            # Confident predictions need no alternatives; skip the hint work
+            if confidence >= 0.8:
+                return lang_code, confidence, []
+            
+            # langid.py only returns the top prediction, so we use our
+            # language hints to provide alternatives
+            hints = self._language_hints(text)
             
-            # For langid, we can't easily get multiple predictions, so we'll use
-            # our language hints to provide alternatives
-            if confidence < 0.8:  # If not very confident, provide alternatives
-                hints = self._get_language_hints(text)
-                
-                # Sort other supported languages by hints
-                other_langs = [lang for lang in self.SUPPORTED_LANGUAGES if lang != lang_code]
-                for other_lang in other_langs:
-                    # Simple scoring based on hints
-                    hint_score = hints.get(f'{other_lang}_stopwords', 0) * 0.5
-                    hint_score += hints.get(f'{other_lang}_chars', 0) * 0.3
-                    
-                    if hint_score > 0.1:  # Only include if there's some evidence
-                        alternatives.append((other_lang, min(hint_score, confidence * 0.8)))
-                
-                # Sort alternatives by score
-                alternatives.sort(key=lambda x: x[1], reverse=True)
+            # Score other supported languages by hints, keeping only those
+            # with some evidence
+            max_score = confidence * 0.8
+            alternatives = [
+                (other_lang, min(hint_score, max_score))
+                for other_lang, hint_score in self._score_hints(hints, lang_code, 0.5, 0.3)
+                if hint_score > 0.1
+            ]
             
-            return lang_code, confidence, alternatives[:3]  # Top 3 alternatives
+            # Top 3 alternatives by score
+            return lang_code, confidence, heapq.nlargest(3, alternatives, key=itemgetter(1))
         
         except Exception as e:
             logger.error(f"LangID detection error: {e}")
@@ -91,27 +125,38 @@ class LangIDDetector(BaseLanguageDetector):
         """Setup langid with our configuration."""
         try:
             # Configure langid to only detect our supported languages if requested
-            if self.restrict_languages:
-                # Set language filter to only our supported languages
-                supported_langs = list(self.SUPPORTED_LANGUAGES)
-                langid.set_languages(supported_langs)
-                logger.info(f"LangID configured for languages: {supported_langs}")
+            supported_langs = sorted(self.SUPPORTED_LANGUAGES) if self.restrict_languages else None
             
-            # Use the global langid identifier
-            self._identifier = langid
+            if self.normalize_scores:
+                # Shared probability-normalized identifier, so confidences are 0-1
+                self._identifier = _get_normalized_identifier(
+                    tuple(supported_langs) if supported_langs else None
+                )
+            else:
+                # Use the global langid identifier (raw log-probability scores)
+                if supported_langs:
+                    langid.set_languages(supported_langs)
+                self._identifier = langid
+            
+            if supported_langs:
+                logger.info(f"LangID configured for languages: {supported_langs}")
             
             logger.info("LangID detector initialized successfully")
         
         except Exception as e:
             raise LanguageDetectionError(f"Failed to setup langid: {e}")
     
-    def get_confidence_distribution(self, text: str) -> dict:
+    def get_confidence_distribution(self, text: str, only_top: Optional[int] = None) -> dict:
         """Get confidence distribution for all supported languages.
         
         This is a custom method since langid doesn't provide this directly.
         We'll use multiple approaches to estimate confidence for each language.
+        
+        Args:
+            text: Text to analyze
+            only_top: Return only the N most confident languages (None for all)
         """
-        if not text.strip():
+        if self._is_too_short(text):
             return {}
         
         distribution = {}
@@ -120,26 +165,52 @@ class LangIDDetector(BaseLanguageDetector):
         primary_lang, primary_conf, _ = self._detect_language_impl(text)
         distribution[primary_lang] = primary_conf
         
-        # For other languages, use heuristics
-        hints = self._get_language_hints(text)
-        
-        for lang in self.SUPPORTED_LANGUAGES:
-            if lang != primary_lang:
-                # Estimate confidence based on stopwords and character patterns
-                stopword_score = hints.get(f'{lang}_stopwords', 0)
-                char_score = hints.get(f'{lang}_chars', 0)
-                
-                # Combine scores
-                estimated_conf = (stopword_score * 0.6) + (char_score * 0.4)
-                
-                # Cap at 80% of primary confidence to maintain ranking
-                estimated_conf = min(estimated_conf, primary_conf * 0.8)
-                
-                if estimated_conf > 0.1:  # Only include meaningful scores
-                    distribution[lang] = estimated_conf
+        # The primary detection always ranks first; no need for hints
+        if only_top is not None and only_top <= 1:
+            return distribution if only_top == 1 else {}
+        
+        # For other languages, use heuristics (shared with the detection above)
+        hints = self._language_hints(text)
+        
+        # Cap at 80% of primary confidence to maintain ranking
+        max_conf = primary_conf * 0.8
+        
+        for lang, estimated_conf in self._score_hints(hints, primary_lang, 0.6, 0.4):
+            estimated_conf = min(estimated_conf, max_conf)
+            
+            if estimated_conf > 0.1:  # Only include meaningful scores
+                distribution[lang] = estimated_conf
+        
+        if only_top is not None and len(distribution) > only_top:
+            distribution = dict(heapq.nlargest(only_top, distribution.items(), key=itemgetter(1)))
         
         return distribution
     
+    def _score_hints(
+        self,
+        hints: Dict[str, float],
+        exclude: str,
+        stopword_weight: float,
+        char_weight: float
+    ) -> List[Tuple[str, float]]:
+        """Combine stopword and character hints into a score per supported language.
+        
+        Args:
+            hints: Hints from _get_language_hints()
+            exclude: Language to leave out (usually the primary detection)
+            stopword_weight: Weight of the stopword ratio
+            char_weight: Weight of the special-character ratio
+            
+        Returns:
+            List of (language, score) tuples
+        """
+        get = hints.get
+        return [
+            (lang, get(stopwords_key, 0) * stopword_weight + get(chars_key, 0) * char_weight)
+            for lang, stopwords_key, chars_key in self._hint_keys
+            if lang != exclude
+        ]
+    
     @staticmethod
     def check_availability() -> dict:
         """Check if langid.py is available."""
@@ -209,14 +280,19 @@ class LangIDDetector(BaseLanguageDetector):
         Returns:
             List of (language, confidence) tuples
         """
-        results = []
-        
-        for text in texts:
-            try:
-                detection = self.detect_block(text)
-                results.append((detection.detected_language, detection.confidence))
-            except Exception as e:
-                logger.warning(f"Batch detection failed for text: {e}")
-                results.append(('unknown', 0.0))
+        # langid's classifier spends its time in NumPy, which releases the
+        # GIL, so larger batches are spread over a thread pool
+        if len(texts) >= self.parallel_batch_min and self.max_workers != 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                return list(executor.map(self._detect_one, texts))
         
-        return results
+        return [self._detect_one(text) for text in texts]
+    
+    def _detect_one(self, text: str) -> Tuple[str, float]:
+        """Detect language of one batch item, mapping failures to 'unknown'."""
+        try:
+            detection = self.detect_block(text)
+            return detection.detected_language, detection.confidence
+        except Exception as e:
+            logger.warning(f"Batch detection failed for text: {e}")
+            return 'unknown', 0.0
@@ -5,7 +5,7 @@ from transqa.core.verification.languagetool_verifier import LanguageToolVerifier
 from transqa.core.verification.placeholder_validator import PlaceholderValidator
 from transqa.core.verification.heuristic_verifier import HeuristicVerifier
 from transqa.core.verification.composite_verifier import CompositeVerifier
-from transqa.core.verification.factory import VerifierFactory
+from transqa.core.verification.factory import VerifierFactory, VerifierKind
 
 __all__ = [
     "BaseVerifier",
@@ -14,4 +14,5 @@ __all__ = [
     "HeuristicVerifier",
     "CompositeVerifier",
     "VerifierFactory",
+    "VerifierKind",
 ]
@@ -25,6 +25,21 @@ class BaseVerifier(BaseAnalyzer, ABC):
         'angle_brackets': re.compile(r'<[^>]*>'),           # <placeholder>
     }
     
+    # Every placeholder pattern starts with one of these characters; the
+    # patterns to try at each occurrence, in PLACEHOLDER_PATTERNS order
+    PLACEHOLDER_START_PATTERN = re.compile(r'[{%$:\[<]')
+    PATTERNS_BY_START_CHAR = {
+        '{': ('curly_braces', 'double_curly'),
+        '%': ('printf_style',),
+        '$': ('dollar_braces',),
+        ':': ('colon_params',),
+        '[': ('square_brackets',),
+        '<': ('angle_brackets',),
+    }
+    
+    # Placeholder styles that get per-placeholder (nested/empty) checks
+    CHECKED_PLACEHOLDER_STYLES = frozenset({'curly_braces', 'square_brackets'})
+    
     URL_PATTERN = re.compile(r'https?://[^\s]+')
     EMAIL_PATTERN = re.compile(r'\S+@\S+\.\S+')
     NUMBER_PATTERNS = {
@@ -33,6 +48,27 @@ class BaseVerifier(BaseAnalyzer, ABC):
         'nl': re.compile(r'\d{1,3}(?:\.\d{3})*(?:,\d+)?'),  # 1.234.567,89 (like Spanish)
     }
     
+    # Number formats that are wrong for a given locale
+    EUROPEAN_NUMBER_PATTERN = re.compile(r'\d{1,3}(?:\.\d{3})+,\d+')  # 1.234,56
+    US_NUMBER_PATTERN = re.compile(r'\d{1,3}(?:,\d{3})+\.\d+')        # 1,234.56
+    
+    # target_lang -> (wrong-format pattern, message, suggestion, rule id)
+    _US_FORMAT_SUGGESTION = "Use US format with commas as thousands separator and period as decimal: 1,234.56"
+    _EUROPEAN_FORMAT_SUGGESTION = "Use European format with periods as thousands separator and comma as decimal: 1.234,56"
+    WRONG_NUMBER_FORMATS = {
+        'en': (EUROPEAN_NUMBER_PATTERN, "European number format in English text",
+               _US_FORMAT_SUGGESTION, "INCORRECT_NUMBER_FORMAT_EN"),
+        'es': (US_NUMBER_PATTERN, "US number format in ES text",
+               _EUROPEAN_FORMAT_SUGGESTION, "INCORRECT_NUMBER_FORMAT_ES"),
+        'nl': (US_NUMBER_PATTERN, "US number format in NL text",
+               _EUROPEAN_FORMAT_SUGGESTION, "INCORRECT_NUMBER_FORMAT_NL"),
+    }
+    
+    # Punctuation and spacing rules
+    DOUBLE_SPACE_PATTERN = re.compile(r'  +')
+    SPANISH_BAD_SPACING_PATTERN = re.compile(r' +[¿¡]')
+    TRAILING_PUNCT_SPACE_PATTERN = re.compile(r'[.!?] +$')
+    
     def __init__(self, config: Optional[dict] = None):
         """Initialize the verifier with configuration."""
         super().__init__(config)
@@ -60,6 +96,10 @@ class BaseVerifier(BaseAnalyzer, ABC):
         
         # Severity overrides
         self.severity_overrides = self.config.get('severity_overrides', {})
+        
+        # Lookup tables keyed by issue type value ('grammar', 'placeholder', ...)
+        self._severity_by_type = {self._issue_type_key(k): v for k, v in self.severity_mapping.items()}
+        self._type_severity_overrides = {self._issue_type_key(k): v for k, v in self.severity_overrides.items()}
     
     def initialize(self) -> None:
         """Initialize the verifier."""
@@ -81,27 +121,78 @@ class BaseVerifier(BaseAnalyzer, ABC):
         Returns:
             List of detected issues
         """
-        if not text or len(text.strip()) < self.min_text_length:
+        if not text:
             return []
         
-        # Preprocess text if needed
+        # Preprocess text if needed (strips and enforces min_text_length)
         processed_text = self._preprocess_text(text)
         if not processed_text:
             return []
         
         # Run implementation-specific checks
         issues = self._check_impl(processed_text, target_lang, context)
+        return self._finalize_issues(text, issues, context)
+    
+    def check_batch(
+        self,
+        texts: List[str],
+        target_lang: str,
+        contexts: Optional[List[Optional[TextBlock]]] = None
+    ) -> List[List[Issue]]:
+        """Check several texts at once.
+        
+        Args:
+            texts: Texts to check
+            target_lang: Expected target language (es, en, nl)
+            contexts: Optional context for each text, aligned with texts
+            
+        Returns:
+            One list of detected issues per input text
+        """
+        if contexts is None:
+            contexts = [None] * len(texts)
+        
+        results = [[] for _ in texts]
+        
+        # Preprocess every text; only non-empty ones go to the batch check
+        indices = []
+        processed_texts = []
+        for i, text in enumerate(texts):
+            processed_text = self._preprocess_text(text) if text else ""
+            if processed_text:
+                indices.append(i)
+                processed_texts.append(processed_text)
+        
+        if not indices:
+            return results
+        
+        batch_contexts = [contexts[i] for i in indices]
+        batch_issues = self._check_impl_batch(processed_texts, target_lang, batch_contexts)
+        for i, issues in zip(indices, batch_issues):
+            results[i] = self._finalize_issues(texts[i], issues, contexts[i])
+        
+        return results
+    
+    def _finalize_issues(self, text: str, issues: List[Issue], context: Optional[TextBlock]) -> List[Issue]:
+        """Apply rule filters, severity overrides and context to checked issues."""
+        # Nothing to filter, override or annotate: hand the issues back as-is
+        if not (context or self.ignore_rules or self.enable_rules or self.severity_overrides):
+            return issues
         
         # Post-process issues
+        should_include = self._should_include_issue
+        effective_severity = self._get_effective_severity
+        xpath = context.xpath if context else None
+        
         filtered_issues = []
         for issue in issues:
             # Apply rule filtering
-            if self._should_include_issue(issue):
+            if should_include(issue):
                 # Apply severity overrides
-                issue.severity = self._get_effective_severity(issue)
+                issue.severity = effective_severity(issue)
                 # Update context if available
                 if context:
-                    issue.xpath = context.xpath
+                    issue.xpath = xpath
                     if not issue.context:
                         issue.context = self._extract_context(text, issue.offset_start, issue.offset_end)
                 
@@ -109,6 +200,12 @@ class BaseVerifier(BaseAnalyzer, ABC):
         
         return filtered_issues
     
+    def _check_impl_batch(
+        self, texts: List[str], target_lang: str, contexts: List[Optional[TextBlock]]
+    ) -> List[List[Issue]]:
+        """Implementation-specific checking of several texts; override to batch work."""
+        return [self._check_impl(text, target_lang, context) for text, context in zip(texts, contexts)]
+    
     @abstractmethod
     def _check_impl(self, text: str, target_lang: str, context: Optional[TextBlock] = None) -> List[Issue]:
         """Implementation-specific text checking."""
@@ -141,21 +238,39 @@ class BaseVerifier(BaseAnalyzer, ABC):
             return ""
         
         # Skip URLs if configured
-        if self.skip_urls and self.URL_PATTERN.search(processed):
-            if len(self.URL_PATTERN.sub('', processed).strip()) < self.min_text_length:
-                return ""
+        if self.skip_urls and self._length_without(self.URL_PATTERN, processed) < self.min_text_length:
+            return ""
         
         # Skip emails if configured
-        if self.skip_emails and self.EMAIL_PATTERN.search(processed):
-            if len(self.EMAIL_PATTERN.sub('', processed).strip()) < self.min_text_length:
-                return ""
+        if self.skip_emails and self._length_without(self.EMAIL_PATTERN, processed) < self.min_text_length:
+            return ""
         
         return processed
     
+    def _length_without(self, pattern: "re.Pattern[str]", text: str) -> int:
+        """Length of stripped text once pattern matches are removed, tallied in one scan."""
+        matched = 0
+        first = last = None
+        for match in pattern.finditer(text):
+            if first is None:
+                first = match
+            last = match
+            matched += match.end() - match.start()
+        
+        if first is None:
+            return len(text)
+        
+        remaining = len(text) - matched
+        # text is already stripped, so removal can only expose whitespace
+        # at the ends when a match touches them
+        if remaining >= self.min_text_length and (first.start() == 0 or last.end() == len(text)):
+            return len(pattern.sub('', text).strip())
+        return remaining
+    
     def _should_include_issue(self, issue: Issue) -> bool:
         """Check if an issue should be included based on filters."""
-        # Check ignore rules
-        if issue.rule_id and issue.rule_id in self.ignore_rules:
+        # Check ignore rules (empty set tested first, the common case)
+        if self.ignore_rules and issue.rule_id in self.ignore_rules:
             return False
         
         # Check enable rules (if specified, only include enabled rules)
@@ -166,18 +281,28 @@ class BaseVerifier(BaseAnalyzer, ABC):
     
     def _get_effective_severity(self, issue: Issue) -> Severity:
         """Get effective severity for an issue, applying overrides."""
+        overrides = self.severity_overrides
+        if not overrides:
+            return issue.severity
+        
         # Check specific rule overrides first
-        if issue.rule_id and issue.rule_id in self.severity_overrides:
-            return Severity(self.severity_overrides[issue.rule_id])
+        rule_id = issue.rule_id
+        if rule_id and rule_id in overrides:
+            return Severity(overrides[rule_id])
         
         # Check issue type overrides
-        issue_type_str = str(issue.type)
-        if issue_type_str in self.severity_overrides:
-            return Severity(self.severity_overrides[issue_type_str])
+        override = self._type_severity_overrides.get(self._issue_type_key(issue.type))
+        if override is not None:
+            return Severity(override)
         
         # Return original severity
         return issue.severity
     
+    @staticmethod
+    def _issue_type_key(issue_type) -> str:
+        """Normalize an IssueType member or type name to its lowercase value."""
+        return str(getattr(issue_type, 'value', issue_type)).lower()
+    
     def _extract_context(self, full_text: str, start: int, end: int, context_chars: int = 50) -> str:
         """Extract context around an issue."""
         try:
@@ -213,7 +338,7 @@ class BaseVerifier(BaseAnalyzer, ABC):
     ) -> Issue:
         """Create a standardized issue."""
         # Determine severity
-        severity = self.severity_mapping.get(str(issue_type), Severity.WARNING)
+        severity = self._severity_by_type.get(self._issue_type_key(issue_type), Severity.WARNING)
         
         # Extract snippet
         snippet = text[start:end] if start < len(text) and end <= len(text) else text
@@ -241,14 +366,24 @@ class BaseVerifier(BaseAnalyzer, ABC):
         Returns:
             List of (pattern_name, match_object, start, end) tuples
         """
+        # One pass over the opening characters, trying each pattern there.
+        # Patterns may overlap each other ({url} inside <a href="{url}">), but
+        # matches of one pattern never do, exactly as with per-pattern finditer
+        patterns = self.PLACEHOLDER_PATTERNS
+        last_end = dict.fromkeys(patterns, 0)
         placeholders = []
         
-        for pattern_name, pattern in self.PLACEHOLDER_PATTERNS.items():
-            for match in pattern.finditer(text):
-                placeholders.append((pattern_name, match, match.start(), match.end()))
-        
-        # Sort by position
-        placeholders.sort(key=lambda x: x[2])
+        for start in self.PLACEHOLDER_START_PATTERN.finditer(text):
+            pos = start.start()
+            for pattern_name in self.PATTERNS_BY_START_CHAR[text[pos]]:
+                if pos < last_end[pattern_name]:
+                    continue
+                match = patterns[pattern_name].match(text, pos)
+                if match:
+                    placeholders.append((pattern_name, match, pos, match.end()))
+                    last_end[pattern_name] = match.end()
+        
+        # Already sorted by position, ties in PLACEHOLDER_PATTERNS order
         return placeholders
     
     def _validate_placeholder_consistency(self, text: str, target_lang: str) -> List[Issue]:
@@ -277,13 +412,18 @@ class BaseVerifier(BaseAnalyzer, ABC):
             )
             issues.append(issue)
         
-        # Check individual placeholders for common issues
+        # Check individual placeholders for common issues; only brace and
+        # bracket styles have per-placeholder rules, so skip the rest outright
         for pattern_name, group in placeholder_groups.items():
+            if pattern_name not in self.CHECKED_PLACEHOLDER_STYLES:
+                continue
+            
+            is_curly = pattern_name == 'curly_braces'
             for match, start, end in group:
                 placeholder_text = match.group()
                 
                 # Check for nested placeholders
-                if pattern_name == 'curly_braces' and '{{' in placeholder_text:
+                if is_curly and '{{' in placeholder_text:
                     issue = self._create_issue(
                         IssueType.PLACEHOLDER,
                         f"Potentially nested placeholder: {placeholder_text}",
@@ -294,7 +434,7 @@ class BaseVerifier(BaseAnalyzer, ABC):
                     issues.append(issue)
                 
                 # Check for empty placeholders
-                if pattern_name in ['curly_braces', 'square_brackets'] and len(placeholder_text) <= 2:
+                if end - start <= 2:
                     issue = self._create_issue(
                         IssueType.PLACEHOLDER,
                         f"Empty placeholder: {placeholder_text}",
@@ -310,41 +450,21 @@ class BaseVerifier(BaseAnalyzer, ABC):
         """Check number format consistency for target language."""
         issues = []
         
-        if target_lang not in self.NUMBER_PATTERNS:
-            return issues
-        
-        pattern = self.NUMBER_PATTERNS[target_lang]
-        numbers = list(pattern.finditer(text))
-        
-        if not numbers:
+        wrong_format = self.WRONG_NUMBER_FORMATS.get(target_lang)
+        if wrong_format is None:
             return issues
         
-        # For languages with specific formatting rules
-        if target_lang == 'en':
-            # Check for incorrect European formatting in English text
-            european_pattern = re.compile(r'\d{1,3}(?:\.\d{3})+,\d+')  # 1.234,56
-            for match in european_pattern.finditer(text):
-                issue = self._create_issue(
-                    IssueType.CONSISTENCY,
-                    f"European number format in English text: {match.group()}",
-                    text, match.start(), match.end(), target_lang,
-                    suggestion="Use US format with commas as thousands separator and period as decimal: 1,234.56",
-                    rule_id="INCORRECT_NUMBER_FORMAT_EN"
-                )
-                issues.append(issue)
-        
-        elif target_lang in ['es', 'nl']:
-            # Check for US formatting in European text
-            us_pattern = re.compile(r'\d{1,3}(?:,\d{3})+\.\d+')  # 1,234.56
-            for match in us_pattern.finditer(text):
-                issue = self._create_issue(
-                    IssueType.CONSISTENCY,
-                    f"US number format in {target_lang.upper()} text: {match.group()}",
-                    text, match.start(), match.end(), target_lang,
-                    suggestion="Use European format with periods as thousands separator and comma as decimal: 1.234,56",
-                    rule_id=f"INCORRECT_NUMBER_FORMAT_{target_lang.upper()}"
-                )
-                issues.append(issue)
+        # Flag numbers written in the other locale's format
+        pattern, description, suggestion, rule_id = wrong_format
+        for match in pattern.finditer(text):
+            issue = self._create_issue(
+                IssueType.CONSISTENCY,
+                f"{description}: {match.group()}",
+                text, match.start(), match.end(), target_lang,
+                suggestion=suggestion,
+                rule_id=rule_id
+            )
+            issues.append(issue)
         
         return issues
     
@@ -353,8 +473,7 @@ class BaseVerifier(BaseAnalyzer, ABC):
         issues = []
         
         # Check for double spaces
-        double_space_pattern = re.compile(r'  +')
-        for match in double_space_pattern.finditer(text):
+        for match in self.DOUBLE_SPACE_PATTERN.finditer(text):
             issue = self._create_issue(
                 IssueType.PUNCTUATION,
                 f"Multiple consecutive spaces: {len(match.group())} spaces",
@@ -367,8 +486,7 @@ class BaseVerifier(BaseAnalyzer, ABC):
         # Check spacing around punctuation (language-specific rules)
         if target_lang == 'es':
             # Spanish: No space before question/exclamation marks
-            bad_spacing = re.compile(r' +[¿¡]')
-            for match in bad_spacing.finditer(text):
+            for match in self.SPANISH_BAD_SPACING_PATTERN.finditer(text):
                 issue = self._create_issue(
                     IssueType.PUNCTUATION,
                     f"Incorrect spacing before Spanish punctuation: {match.group()}",
@@ -379,9 +497,8 @@ class BaseVerifier(BaseAnalyzer, ABC):
                 issues.append(issue)
         
         # Check trailing punctuation spaces (common to all languages)
-        trailing_punct_space = re.compile(r'[.!?] +$')
-        if trailing_punct_space.search(text):
-            match = trailing_punct_space.search(text)
+        match = self.TRAILING_PUNCT_SPACE_PATTERN.search(text)
+        if match:
             issue = self._create_issue(
                 IssueType.PUNCTUATION,
                 "Trailing spaces after final punctuation",
@@ -1,7 +1,10 @@
 """Composite verifier that combines multiple verification methods."""
 
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import perf_counter
+from typing import Iterator, List, Optional, Tuple
 
 from transqa.core.verification.base import BaseVerifier
 from transqa.core.interfaces import Issue, TextBlock
@@ -12,6 +15,14 @@ logger = logging.getLogger(__name__)
 class CompositeVerifier(BaseVerifier):
     """Verifier that combines multiple verification methods for comprehensive checking."""
     
+    # Priority used to break confidence ties between duplicates (higher is better)
+    _VERIFIER_PRIORITIES = {
+        'LanguageToolVerifier': 100,  # Highest priority - most accurate
+        'PlaceholderValidator': 90,   # High priority - specific domain
+        'HeuristicVerifier': 80,      # Medium priority - broader rules
+    }
+    DEFAULT_VERIFIER_PRIORITY = 50
+    
     def __init__(self, verifiers: List[BaseVerifier], config: Optional[dict] = None):
         """Initialize composite verifier with multiple verifiers.
         
@@ -33,6 +44,9 @@ class CompositeVerifier(BaseVerifier):
         
         # Performance tracking
         self.verifier_stats = {}
+        
+        # Worker pool for parallel_processing, created on initialize()
+        self._executor = None
     
     def initialize(self) -> None:
         """Initialize all component verifiers."""
@@ -47,12 +61,21 @@ class CompositeVerifier(BaseVerifier):
             except Exception as e:
                 logger.warning(f"Failed to initialize verifier {i} ({verifier.__class__.__name__}): {e}")
         
+        if self.parallel_processing and len(self.verifiers) > 1 and self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.verifiers), thread_name_prefix="transqa-verifier"
+            )
+        
         logger.info(f"Composite verifier initialized with {initialized_count} active verifiers")
     
     def cleanup(self) -> None:
         """Cleanup all component verifiers."""
         super().cleanup()
         
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
         for verifier in self.verifiers:
             try:
                 verifier.cleanup()
@@ -61,21 +84,35 @@ class CompositeVerifier(BaseVerifier):
     
     def _check_impl(self, text: str, target_lang: str, context: Optional[TextBlock] = None) -> List[Issue]:
         """Run all verifiers and combine results."""
-        all_issues = []
+        return self._check_impl_batch([text], target_lang, [context])[0]
+    
+    def _check_impl_batch(
+        self, texts: List[str], target_lang: str, contexts: List[Optional[TextBlock]]
+    ) -> List[List[Issue]]:
+        """Run every verifier once over the whole batch and combine results per text."""
+        all_issues = [[] for _ in texts]
+        
+        # Verifiers are independent, so with parallel_processing they run
+        # concurrently; results are still collected in verifier order
+        if self._executor is not None:
+            futures = [
+                self._executor.submit(self._run_verifier, verifier, texts, target_lang, contexts)
+                for verifier in self.verifiers
+            ]
+            runs = ((verifier, future.result) for verifier, future in zip(self.verifiers, futures))
+        else:
+            runs = (
+                (verifier, partial(self._run_verifier, verifier, texts, target_lang, contexts))
+                for verifier in self.verifiers
+            )
         
         # Run each verifier
-        for verifier in self.verifiers:
+        for verifier, run in runs:
             try:
                 verifier_name = verifier.__class__.__name__
                 
-                # Run verifier
-                import time
-                start_time = time.time()
-                
-                issues = verifier.check(text, target_lang, context)
-                
-                end_time = time.time()
-                duration = end_time - start_time
+                results, duration = run()
+                issue_count = sum(map(len, results))
                 
                 # Track performance
                 if verifier_name not in self.verifier_stats:
@@ -87,121 +124,174 @@ class CompositeVerifier(BaseVerifier):
                     }
                 
                 stats = self.verifier_stats[verifier_name]
-                stats['total_checks'] += 1
-                stats['total_issues'] += len(issues)
+                stats['total_checks'] += len(texts)
+                stats['total_issues'] += issue_count
                 stats['total_time'] += duration
                 stats['avg_time'] = stats['total_time'] / stats['total_checks']
                 
-                # Tag issues with source verifier
-                for issue in issues:
-                    if not hasattr(issue, '_source_verifier'):
-                        issue._source_verifier = verifier_name
+                for issues, text_issues in zip(results, all_issues):
+                    self._tag_issues(verifier, verifier_name, issues)
+                    text_issues.extend(issues)
                 
-                all_issues.extend(issues)
-                
-                logger.debug(f"{verifier_name}: {len(issues)} issues in {duration:.3f}s")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"{verifier_name}: {issue_count} issues in {len(texts)} texts in {duration:.3f}s")
             
             except Exception as e:
                 logger.error(f"Verifier {verifier.__class__.__name__} failed: {e}")
         
         # Post-process issues
-        if self.deduplicate_issues:
-            all_issues = self._deduplicate_issues(all_issues)
+        return [self._postprocess_issues(issues) for issues in all_issues]
+    
+    def _tag_issues(self, verifier: BaseVerifier, verifier_name: str, issues: List[Issue]) -> None:
+        """Tag issues with source verifier, its resolved priority and the deduplication key."""
+        # The deduplication key is always refreshed, since a nested composite
+        # may have merged the issue after tagging it
+        if isinstance(verifier, CompositeVerifier):
+            # Keep the leaf verifier tags set by the nested composite
+            for issue in issues:
+                if not hasattr(issue, '_source_verifier'):
+                    issue._source_verifier = verifier_name
+                issue._priority = self._get_verifier_priority(issue)
+                issue._dedup_key = self._dedup_key(issue)
+        else:
+            # Leaf verifiers return fresh issues, so tag unconditionally
+            priority = self._VERIFIER_PRIORITIES.get(verifier_name, self.DEFAULT_VERIFIER_PRIORITY)
+            for issue in issues:
+                issue._source_verifier = verifier_name
+                issue._priority = priority
+                issue._dedup_key = self._dedup_key(issue)
+    
+    @staticmethod
+    def _run_verifier(
+        verifier: BaseVerifier, texts: List[str], target_lang: str, contexts: List[Optional[TextBlock]]
+    ) -> Tuple[List[List[Issue]], float]:
+        """Run one verifier over a batch, returning per-text issues and how long it took."""
+        start_time = perf_counter()
+        results = verifier.check_batch(texts, target_lang, contexts)
+        return results, perf_counter() - start_time
+    
+    @staticmethod
+    def _dedup_key(issue: Issue) -> tuple:
+        """Key under which issues count as duplicates of each other."""
+        return (issue.offset_start, issue.offset_end, issue.type, issue.message.lower())
+    
+    def _postprocess_issues(self, issues: List[Issue]) -> List[Issue]:
+        """Deduplicate and merge issues, feeding one stage straight into the next."""
+        if not issues:
+            return issues
         
+        candidates = self._iter_best_duplicates(issues) if self.deduplicate_issues else issues
         if self.merge_overlapping:
-            all_issues = self._merge_overlapping_issues(all_issues)
+            processed = self._merge_sorted_issues(sorted(candidates, key=self._position_key))
+        else:
+            processed = list(candidates)
         
-        return all_issues
+        if len(processed) != len(issues):
+            logger.debug(f"Post-processed {len(issues)} -> {len(processed)} issues")
+        
+        return processed
     
     def _deduplicate_issues(self, issues: List[Issue]) -> List[Issue]:
         """Remove duplicate issues based on position and type."""
         if not issues:
             return issues
         
-        # Group issues by position and type for deduplication
-        issue_groups = {}
-        
-        for issue in issues:
-            # Create key based on position and type
-            key = (issue.offset_start, issue.offset_end, issue.type, issue.message.lower())
-            
-            if key not in issue_groups:
-                issue_groups[key] = []
-            issue_groups[key].append(issue)
-        
-        # Keep best issue from each group
-        deduplicated = []
-        for group in issue_groups.values():
-            if len(group) == 1:
-                deduplicated.append(group[0])
-            else:
-                # Choose best issue based on confidence and source
-                best_issue = max(group, key=lambda x: (x.confidence, self._get_verifier_priority(x)))
-                
-                # Merge information from other issues if useful
-                other_issues = [i for i in group if i != best_issue]
-                if other_issues:
-                    # Combine suggestions if different
-                    suggestions = set()
-                    if best_issue.suggestion:
-                        suggestions.add(best_issue.suggestion)
-                    
-                    for other in other_issues:
-                        if other.suggestion and other.suggestion != best_issue.suggestion:
-                            suggestions.add(other.suggestion)
-                    
-                    if len(suggestions) > 1:
-                        best_issue.suggestion = "; ".join(suggestions)
-                
-                deduplicated.append(best_issue)
+        deduplicated = list(self._iter_best_duplicates(issues))
         
         logger.debug(f"Deduplicated {len(issues)} -> {len(deduplicated)} issues")
         return deduplicated
     
+    def _iter_best_duplicates(self, issues: List[Issue]) -> Iterator[Issue]:
+        """Yield the best issue for each duplicate key, in first-seen order."""
+        # Keep the best issue per position/type key as we go; suggestions are
+        # only collected (in first-seen order) for keys that actually collide
+        best = {}
+        extras = {}
+        
+        for issue in issues:
+            # Key based on position and type, precomputed at ingestion when possible
+            key = getattr(issue, '_dedup_key', None)
+            if key is None:
+                key = self._dedup_key(issue)
+            priority = getattr(issue, '_priority', None)
+            if priority is None:
+                priority = self._get_verifier_priority(issue)
+            score = (issue.confidence, priority)
+            
+            current = best.get(key)
+            if current is None:
+                best[key] = (issue, score)
+                continue
+            
+            suggestions = extras.get(key)
+            if suggestions is None:
+                suggestions = extras[key] = {}
+                if current[0].suggestion:
+                    suggestions[current[0].suggestion] = None
+            if issue.suggestion:
+                suggestions[issue.suggestion] = None
+            
+            # Choose best issue based on confidence and source
+            if score > current[1]:
+                best[key] = (issue, score)
+        
+        for key, (issue, _) in best.items():
+            # Combine suggestions if different
+            suggestions = extras.get(key)
+            if suggestions and len(suggestions) > 1:
+                issue.suggestion = "; ".join(suggestions)
+            
+            yield issue
+    
     def _merge_overlapping_issues(self, issues: List[Issue]) -> List[Issue]:
         """Merge overlapping issues of the same type."""
         if not issues:
             return issues
         
-        # Sort issues by position
-        issues.sort(key=lambda x: (x.offset_start, x.offset_end))
+        # Sort a copy by position so the caller's list is left untouched
+        merged = self._merge_sorted_issues(sorted(issues, key=self._position_key))
+        
+        if len(merged) != len(issues):
+            logger.debug(f"Merged {len(issues)} -> {len(merged)} overlapping issues")
+        
+        return merged
+    
+    @staticmethod
+    def _position_key(issue: Issue) -> Tuple[int, int]:
+        """Sort key ordering issues by span."""
+        return (issue.offset_start, issue.offset_end)
+    
+    def _merge_sorted_issues(self, sorted_issues: List[Issue]) -> List[Issue]:
+        """Sweep position-sorted issues, merging overlapping ones of the same type."""
+        it = iter(sorted_issues)
         
         merged = []
-        current_group = []
+        last_issue = next(it)
+        last_start, last_end, last_type = last_issue.offset_start, last_issue.offset_end, last_issue.type
+        # Only materialized once an overlap is actually found
+        pending = None
         
-        for issue in issues:
-            if not current_group:
-                current_group = [issue]
-                continue
-            
-            last_issue = current_group[-1]
+        for issue in it:
+            start, end, issue_type = issue.offset_start, issue.offset_end, issue.type
             
             # Check if issues overlap and are similar type
-            if (issue.offset_start <= last_issue.offset_end and 
-                issue.type == last_issue.type and
-                abs(issue.offset_start - last_issue.offset_start) < 50):  # Close proximity
+            if (start <= last_end and 
+                issue_type == last_type and
+                abs(start - last_start) < 50):  # Close proximity
                 
-                current_group.append(issue)
+                if pending is None:
+                    pending = [last_issue]
+                pending.append(issue)
             else:
                 # Process current group
-                if len(current_group) == 1:
-                    merged.append(current_group[0])
-                else:
-                    merged_issue = self._merge_issue_group(current_group)
-                    merged.append(merged_issue)
-                
-                current_group = [issue]
+                merged.append(last_issue if pending is None else self._merge_issue_group(pending))
+                pending = None
+            
+            last_issue = issue
+            last_start, last_end, last_type = start, end, issue_type
         
         # Process final group
-        if current_group:
-            if len(current_group) == 1:
-                merged.append(current_group[0])
-            else:
-                merged_issue = self._merge_issue_group(current_group)
-                merged.append(merged_issue)
-        
-        if len(merged) != len(issues):
-            logger.debug(f"Merged {len(issues)} -> {len(merged)} overlapping issues")
+        merged.append(last_issue if pending is None else self._merge_issue_group(pending))
         
         return merged
     
@@ -213,27 +303,40 @@ class CompositeVerifier(BaseVerifier):
         if len(group) == 1:
             return group[0]
         
-        # Use the highest confidence issue as base
-        base_issue = max(group, key=lambda x: x.confidence)
+        # Single pass: highest confidence issue as base, the span covering all
+        # issues, and messages/suggestions in first-seen order
+        base_issue = group[0]
+        base_confidence = base_issue.confidence
+        min_start = base_issue.offset_start
+        max_end = base_issue.offset_end
+        messages = {}
+        suggestions = {}
         
-        # Expand position to cover all issues
-        min_start = min(issue.offset_start for issue in group)
-        max_end = max(issue.offset_end for issue in group)
+        for issue in group:
+            confidence = issue.confidence
+            if confidence > base_confidence:
+                base_issue, base_confidence = issue, confidence
+            
+            start, end = issue.offset_start, issue.offset_end
+            if start < min_start:
+                min_start = start
+            if end > max_end:
+                max_end = end
+            
+            messages[issue.message] = None
+            suggestion = issue.suggestion
+            if suggestion:
+                suggestions[suggestion] = None
         
+        # Expand position to cover all issues
         base_issue.offset_start = min_start
         base_issue.offset_end = max_end
         
         # Combine messages if different
-        messages = set(issue.message for issue in group)
         if len(messages) > 1:
             base_issue.message = f"Multiple issues: {'; '.join(messages)}"
         
         # Combine suggestions
-        suggestions = set()
-        for issue in group:
-            if issue.suggestion:
-                suggestions.add(issue.suggestion)
-        
         if suggestions:
             base_issue.suggestion = "; ".join(suggestions)
         
@@ -245,14 +348,8 @@ class CompositeVerifier(BaseVerifier):
     
     def _get_verifier_priority(self, issue: Issue) -> int:
         """Get priority score for verifier (higher is better)."""
-        verifier_priorities = {
-            'LanguageToolVerifier': 100,  # Highest priority - most accurate
-            'PlaceholderValidator': 90,   # High priority - specific domain
-            'HeuristicVerifier': 80,      # Medium priority - broader rules
-        }
-        
         source_verifier = getattr(issue, '_source_verifier', 'Unknown')
-        return verifier_priorities.get(source_verifier, 50)  # Default priority
+        return self._VERIFIER_PRIORITIES.get(source_verifier, self.DEFAULT_VERIFIER_PRIORITY)
     
     def check_grammar(self, text: str, target_lang: str) -> List[Issue]:
         """Check grammar using all capable verifiers."""
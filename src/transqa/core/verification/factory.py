@@ -1,7 +1,10 @@
 """Factory for creating verifier instances."""
 
+import functools
 import logging
-from typing import Dict, List, Optional
+from enum import Enum
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Union
 
 from transqa.core.verification.base import BaseVerifier
 from transqa.core.verification.composite_verifier import CompositeVerifier
@@ -11,7 +14,100 @@ from transqa.core.interfaces import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
-# Lazy imports to handle optional dependencies
+# Static parts of the verifier configuration built by create_from_config();
+# only the application-dependent fields are filled in per call
+_PLACEHOLDER_CONFIG_TEMPLATE = MappingProxyType({
+    'strict_placeholder_syntax': True,
+    'check_placeholder_consistency': True,
+    'validate_number_formats': True,
+    'check_currency_placement': True,
+    'validate_quote_styles': False,  # Often too strict
+})
+
+_HEURISTIC_CONFIG_TEMPLATE = MappingProxyType({
+    'min_words_for_detection': 3,
+    'confidence_boost_patterns': True,
+    'check_capitalization': True,
+})
+
+_COMPOSITE_CONFIG_TEMPLATE = MappingProxyType({
+    'deduplicate_issues': True,
+    'merge_overlapping': True,
+    'parallel_processing': False,
+})
+
+_SEVERITY_MAPPING = MappingProxyType({
+    'grammar': 'warning',
+    'spelling': 'error',
+    'style': 'info',
+    'placeholder': 'error',
+    'language_leak': 'error',
+    'punctuation': 'warning',
+    'capitalization': 'warning',
+})
+
+_BASE_CONFIG_TEMPLATE = MappingProxyType({
+    'skip_urls': True,
+    'skip_emails': True,
+    'min_text_length': 3,
+})
+
+# Static parts of check_dependencies(); callers get fresh copies via _info_copy()
+_LANGUAGETOOL_INFO = MappingProxyType({
+    'capabilities': (
+        'grammar_checking',
+        'spelling_checking',
+        'style_checking',
+        'multi_language',
+        'rule_customization',
+    ),
+    'limitations': (
+        'requires_java_or_server',
+        'slower_than_heuristics',
+        'internet_for_full_features',
+    ),
+})
+
+_LANGUAGETOOL_MISSING_INFO = MappingProxyType({
+    'available': False,
+    'error': 'Module not found',
+    'install_command': 'pip install language-tool-python',
+})
+
+_HEURISTIC_INFO = MappingProxyType({
+    'available': True,
+    'capabilities': (
+        'language_leakage_detection',
+        'capitalization_rules',
+        'punctuation_rules',
+        'consistency_checking',
+        'fast_processing',
+    ),
+    'limitations': (
+        'rule_based_only',
+        'may_have_false_positives',
+        'less_sophisticated_than_languagetool',
+    ),
+})
+
+_PLACEHOLDER_INFO = MappingProxyType({
+    'available': True,
+    'capabilities': (
+        'placeholder_validation',
+        'number_format_checking',
+        'currency_placement',
+        'quote_consistency',
+        'format_consistency',
+    ),
+    'limitations': (
+        'specific_to_placeholders',
+        'may_flag_intentional_formatting',
+    ),
+})
+
+# Lazy imports to handle optional dependencies; availability cannot change
+# within a process, so the import is attempted only once
+@functools.cache
 def _get_languagetool_verifier():
     """Lazy import of LanguageToolVerifier to handle optional dependency."""
     try:
@@ -21,19 +117,76 @@ def _get_languagetool_verifier():
         return None
 
 
+def _info_copy(info: Mapping[str, any]) -> Dict[str, any]:
+    """Mutable, JSON-serializable copy of a static dependency-info template."""
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in info.items()}
+
+
+def _freeze_config(value):
+    """Hashable snapshot of a (nested) config value, used as an instance cache key."""
+    if isinstance(value, Mapping):
+        return frozenset((key, _freeze_config(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_config(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze_config(item) for item in value)
+    return value
+
+
+class VerifierKind(str, Enum):
+    """Verifier types understood by VerifierFactory.create_verifier.
+    
+    Members compare and hash equal to their string values, so plain strings
+    such as 'composite' remain valid wherever a kind is expected.
+    """
+    AUTO = "auto"
+    LANGUAGETOOL = "languagetool"
+    HEURISTIC = "heuristic"
+    PLACEHOLDER = "placeholder"
+    COMPOSITE = "composite"
+
+
 class VerifierFactory:
     """Factory for creating appropriate verifier instances."""
     
+    # Read-only availability map, computed on first get_available_verifiers()
+    _availability_cache: Optional[Mapping[str, bool]] = None
+    
+    # Kind chosen by 'auto', resolved on first use by _get_best_choice()
+    _best_choice: Optional[VerifierKind] = None
+    
+    # Preference order when only one verifier is available
+    _SINGLE_VERIFIER_PRIORITY = (
+        VerifierKind.LANGUAGETOOL,
+        VerifierKind.HEURISTIC,
+        VerifierKind.PLACEHOLDER,
+    )
+    
+    _BEST_CHOICE_MESSAGES = MappingProxyType({
+        VerifierKind.COMPOSITE: "Creating composite verifier with all available components",
+        VerifierKind.LANGUAGETOOL: "Creating LanguageTool verifier",
+        VerifierKind.HEURISTIC: "Creating heuristic verifier",
+        VerifierKind.PLACEHOLDER: "Creating placeholder validator",
+    })
+    
+    # Shared instances handed out by create_verifier(shared=True)
+    _instance_cache: Dict[tuple, BaseVerifier] = {}
+    
     @staticmethod
     def create_verifier(
-        verifier_type: str = "auto",
-        config: Optional[dict] = None
+        verifier_type: Union[VerifierKind, str] = VerifierKind.AUTO,
+        config: Optional[dict] = None,
+        shared: bool = False
     ) -> BaseVerifier:
         """Create appropriate verifier instance.
         
         Args:
-            verifier_type: Type of verifier ('auto', 'languagetool', 'heuristic', 'placeholder', 'composite')
+            verifier_type: VerifierKind or its value ('auto', 'languagetool', 'heuristic', 'placeholder', 'composite')
             config: Configuration dictionary
+            shared: Reuse the instance previously created for an equal type
+                and configuration. Shared instances are initialized and
+                cleaned up by all of their users, so only opt in when the
+                callers coordinate that lifecycle.
             
         Returns:
             Configured verifier instance
@@ -43,117 +196,127 @@ class VerifierFactory:
         """
         config = config or {}
         
-        if verifier_type == "auto":
-            return VerifierFactory._create_best_available(config)
-        
-        elif verifier_type == "languagetool":
-            LanguageToolVerifier = _get_languagetool_verifier()
-            if LanguageToolVerifier is None:
-                raise ConfigurationError(
-                    "LanguageTool verifier requested but not available. "
-                    "Install with: pip install language-tool-python"
-                )
-            return LanguageToolVerifier(config)
-        
-        elif verifier_type == "heuristic":
-            return HeuristicVerifier(config)
-        
-        elif verifier_type == "placeholder":
-            return PlaceholderValidator(config)
+        constructor = VerifierFactory._CONSTRUCTORS.get(verifier_type)
+        if constructor is None:
+            raise ConfigurationError(f"Unknown verifier type: {verifier_type}")
         
-        elif verifier_type == "composite":
-            return VerifierFactory._create_composite_verifier(config)
+        if not shared:
+            return constructor(config)
         
-        else:
-            raise ConfigurationError(f"Unknown verifier type: {verifier_type}")
+        # VerifierKind members hash like their values, so 'auto' and
+        # VerifierKind.AUTO share an entry
+        key = (verifier_type, _freeze_config(config))
+        verifier = VerifierFactory._instance_cache.get(key)
+        if verifier is None:
+            verifier = VerifierFactory._instance_cache[key] = constructor(config)
+        return verifier
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all shared verifier instances."""
+        VerifierFactory._instance_cache.clear()
+    
+    @staticmethod
+    def _create_languagetool_verifier(config: dict) -> BaseVerifier:
+        """Create LanguageTool verifier, failing if the dependency is missing."""
+        LanguageToolVerifier = _get_languagetool_verifier()
+        if LanguageToolVerifier is None:
+            raise ConfigurationError(
+                "LanguageTool verifier requested but not available. "
+                "Install with: pip install language-tool-python"
+            )
+        return LanguageToolVerifier(config)
+    
+    @staticmethod
+    def _create_heuristic_verifier(config: dict) -> BaseVerifier:
+        """Create heuristic verifier."""
+        return HeuristicVerifier(config)
+    
+    @staticmethod
+    def _create_placeholder_validator(config: dict) -> BaseVerifier:
+        """Create placeholder validator."""
+        return PlaceholderValidator(config)
     
     @staticmethod
     def _create_best_available(config: dict) -> BaseVerifier:
         """Create the best available verifier automatically."""
-        available_verifiers = VerifierFactory.get_available_verifiers()
-        
-        # If multiple verifiers available, create composite for best results
-        available_count = sum(1 for available in available_verifiers.values() if available)
-        
-        if available_count > 1:
-            logger.info("Creating composite verifier with all available components")
-            return VerifierFactory._create_composite_verifier(config)
-        
-        # Single verifier - choose best available
-        elif available_verifiers.get("languagetool", False):
-            logger.info("Creating LanguageTool verifier")
-            LanguageToolVerifier = _get_languagetool_verifier()
-            return LanguageToolVerifier(config)
-        
-        elif available_verifiers.get("heuristic", False):
-            logger.info("Creating heuristic verifier")
-            return HeuristicVerifier(config)
-        
-        elif available_verifiers.get("placeholder", False):
-            logger.info("Creating placeholder validator")
-            return PlaceholderValidator(config)
+        choice = VerifierFactory._get_best_choice()
+        logger.info(VerifierFactory._BEST_CHOICE_MESSAGES[choice])
+        return VerifierFactory._CONSTRUCTORS[choice](config)
+    
+    @staticmethod
+    def _get_best_choice() -> VerifierKind:
+        """Verifier kind picked by 'auto', resolved once from the cached availability."""
+        if VerifierFactory._best_choice is None:
+            available_verifiers = VerifierFactory.get_available_verifiers()
+            
+            # If multiple verifiers available, create composite for best results
+            available_count = sum(1 for available in available_verifiers.values() if available)
+            
+            if available_count > 1:
+                choice = VerifierKind.COMPOSITE
+            else:
+                # Single verifier - choose best available
+                choice = next(
+                    (kind for kind in VerifierFactory._SINGLE_VERIFIER_PRIORITY
+                     if available_verifiers.get(kind, False)),
+                    None
+                )
+                if choice is None:
+                    raise ConfigurationError(
+                        "No verifiers available. This should not happen as heuristic and placeholder "
+                        "verifiers are always available."
+                    )
+            
+            VerifierFactory._best_choice = choice
         
-        else:
-            raise ConfigurationError(
-                "No verifiers available. This should not happen as heuristic and placeholder "
-                "verifiers are always available."
-            )
+        return VerifierFactory._best_choice
     
     @staticmethod
     def _create_composite_verifier(config: dict) -> CompositeVerifier:
         """Create composite verifier with all available verifiers."""
         verifiers = []
         
-        # Try to create each verifier
-        # 1. LanguageTool (if available)
-        LanguageToolVerifier = _get_languagetool_verifier()
-        if LanguageToolVerifier:
+        # Try to create each verifier, in priority order: LanguageTool (if
+        # available), then the always-available placeholder and heuristic ones
+        components = (
+            ('languagetool', "LanguageTool verifier", _get_languagetool_verifier()),
+            ('placeholder', "placeholder validator", PlaceholderValidator),
+            ('heuristic', "heuristic verifier", HeuristicVerifier),
+        )
+        
+        for config_key, label, verifier_class in components:
+            if verifier_class is None:
+                continue
             try:
-                lt_config = config.get('languagetool', {})
-                verifiers.append(LanguageToolVerifier(lt_config))
-                logger.info("Added LanguageTool verifier to composite")
+                verifiers.append(verifier_class(config.get(config_key, {})))
+                logger.info("Added %s to composite", label)
             except Exception as e:
-                logger.warning(f"Failed to create LanguageTool verifier: {e}")
-        
-        # 2. Placeholder Validator (always available)
-        try:
-            placeholder_config = config.get('placeholder', {})
-            verifiers.append(PlaceholderValidator(placeholder_config))
-            logger.info("Added placeholder validator to composite")
-        except Exception as e:
-            logger.warning(f"Failed to create placeholder validator: {e}")
-        
-        # 3. Heuristic Verifier (always available)
-        try:
-            heuristic_config = config.get('heuristic', {})
-            verifiers.append(HeuristicVerifier(heuristic_config))
-            logger.info("Added heuristic verifier to composite")
-        except Exception as e:
-            logger.warning(f"Failed to create heuristic verifier: {e}")
+                logger.warning("Failed to create %s: %s", label, e)
         
         if not verifiers:
             raise ConfigurationError("No verifiers could be created for composite verifier")
         
         # Configure composite verifier
-        composite_config = config.get('composite', {
-            'deduplicate_issues': True,
-            'merge_overlapping': True,
-            'parallel_processing': False,
-        })
+        composite_config = config.get('composite')
+        if composite_config is None:
+            composite_config = dict(_COMPOSITE_CONFIG_TEMPLATE)
         
         return CompositeVerifier(verifiers, composite_config)
     
     @staticmethod
-    def create_from_config(app_config) -> BaseVerifier:
+    def create_from_config(app_config, shared: bool = False) -> BaseVerifier:
         """Create verifier from TransQA configuration object.
         
         Args:
             app_config: TransQAConfig instance
+            shared: Reuse an existing verifier built from an equal configuration
             
         Returns:
             Configured verifier instance
         """
-        # Extract configuration for each verifier type
+        # Extract configuration for each verifier type; the templates are
+        # copied because verifiers keep (and may update) the dicts they are given
         verifier_config = {
             # LanguageTool configuration
             'languagetool': {
@@ -166,43 +329,21 @@ class VerifierFactory:
             },
             
             # Placeholder validator configuration
-            'placeholder': {
-                'strict_placeholder_syntax': True,
-                'check_placeholder_consistency': True,
-                'validate_number_formats': True,
-                'check_currency_placement': True,
-                'validate_quote_styles': False,  # Often too strict
-            },
+            'placeholder': dict(_PLACEHOLDER_CONFIG_TEMPLATE),
             
             # Heuristic verifier configuration
             'heuristic': {
+                **_HEURISTIC_CONFIG_TEMPLATE,
                 'leak_threshold': app_config.rules.leak_threshold,
-                'min_words_for_detection': 3,
-                'confidence_boost_patterns': True,
-                'check_capitalization': True,
                 'whitelist': [],  # Could load from whitelist file
             },
             
             # Composite configuration
-            'composite': {
-                'deduplicate_issues': True,
-                'merge_overlapping': True,
-                'parallel_processing': False,
-            },
+            'composite': dict(_COMPOSITE_CONFIG_TEMPLATE),
             
             # Base configuration for all verifiers
-            'severity_mapping': {
-                'grammar': 'warning',
-                'spelling': 'error',
-                'style': 'info',
-                'placeholder': 'error',
-                'language_leak': 'error',
-                'punctuation': 'warning',
-                'capitalization': 'warning',
-            },
-            'skip_urls': True,
-            'skip_emails': True,
-            'min_text_length': 3,
+            **_BASE_CONFIG_TEMPLATE,
+            'severity_mapping': dict(_SEVERITY_MAPPING),
         }
         
         # Load whitelist if available
@@ -210,24 +351,21 @@ class VerifierFactory:
         if whitelist_path and whitelist_path.exists():
             try:
                 with open(whitelist_path, 'r', encoding='utf-8') as f:
-                    whitelist_terms = []
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            # Handle language-specific terms (term:lang format)
-                            if ':' in line:
-                                term, lang = line.split(':', 1)
-                                whitelist_terms.append(term.strip())
-                            else:
-                                whitelist_terms.append(line)
+                    # Handle language-specific terms (term:lang format); a
+                    # frozenset drops duplicates and gives O(1) lookups
+                    whitelist_terms = frozenset(
+                        line.split(':', 1)[0].strip()
+                        for line in map(str.strip, f)
+                        if line and not line.startswith('#')
+                    )
                     
                     verifier_config['heuristic']['whitelist'] = whitelist_terms
-                    logger.info(f"Loaded {len(whitelist_terms)} whitelist terms")
+                    logger.info("Loaded %d whitelist terms", len(whitelist_terms))
             
             except Exception as e:
-                logger.warning(f"Failed to load whitelist from {whitelist_path}: {e}")
+                logger.warning("Failed to load whitelist from %s: %s", whitelist_path, e)
         
-        return VerifierFactory.create_verifier('auto', verifier_config)
+        return VerifierFactory.create_verifier(VerifierKind.AUTO, verifier_config, shared=shared)
     
     @staticmethod
     def get_available_verifiers() -> Dict[str, bool]:
@@ -236,14 +374,19 @@ class VerifierFactory:
         Returns:
             Dictionary mapping verifier names to availability status
         """
-        LanguageToolVerifier = _get_languagetool_verifier()
-        
-        return {
-            'languagetool': LanguageToolVerifier is not None,
-            'heuristic': True,  # Always available
-            'placeholder': True,  # Always available
-            'composite': True,  # Always available (depends on components)
-        }
+        # Availability cannot change within a process, so compute it once
+        if VerifierFactory._availability_cache is None:
+            LanguageToolVerifier = _get_languagetool_verifier()
+            
+            VerifierFactory._availability_cache = MappingProxyType({
+                'languagetool': LanguageToolVerifier is not None,
+                'heuristic': True,  # Always available
+                'placeholder': True,  # Always available
+                'composite': True,  # Always available (depends on components)
+            })
+        
+        # Hand out a copy so callers cannot change the cached map
+        return dict(VerifierFactory._availability_cache)
     
     @staticmethod
     def check_dependencies(verbose: bool = False) -> Dict[str, Dict[str, any]]:
@@ -263,20 +406,9 @@ class VerifierFactory:
             try:
                 lt_status = LanguageToolVerifier.check_availability()
                 results['languagetool'] = {
+                    **_info_copy(_LANGUAGETOOL_INFO),
                     'available': True,
                     'status': lt_status,
-                    'capabilities': [
-                        'grammar_checking',
-                        'spelling_checking',
-                        'style_checking',
-                        'multi_language',
-                        'rule_customization'
-                    ],
-                    'limitations': [
-                        'requires_java_or_server',
-                        'slower_than_heuristics',
-                        'internet_for_full_features'
-                    ]
                 }
             except Exception as e:
                 results['languagetool'] = {
@@ -285,44 +417,11 @@ class VerifierFactory:
                     'install_command': 'pip install language-tool-python'
                 }
         else:
-            results['languagetool'] = {
-                'available': False,
-                'error': 'Module not found',
-                'install_command': 'pip install language-tool-python'
-            }
+            results['languagetool'] = _info_copy(_LANGUAGETOOL_MISSING_INFO)
         
-        # Check Heuristic Verifier (always available)
-        results['heuristic'] = {
-            'available': True,
-            'capabilities': [
-                'language_leakage_detection',
-                'capitalization_rules',
-                'punctuation_rules',
-                'consistency_checking',
-                'fast_processing'
-            ],
-            'limitations': [
-                'rule_based_only',
-                'may_have_false_positives',
-                'less_sophisticated_than_languagetool'
-            ]
-        }
-        
-        # Check Placeholder Validator (always available)
-        results['placeholder'] = {
-            'available': True,
-            'capabilities': [
-                'placeholder_validation',
-                'number_format_checking',
-                'currency_placement',
-                'quote_consistency',
-                'format_consistency'
-            ],
-            'limitations': [
-                'specific_to_placeholders',
-                'may_flag_intentional_formatting'
-            ]
-        }
+        # Heuristic Verifier and Placeholder Validator (always available)
+        results['heuristic'] = _info_copy(_HEURISTIC_INFO)
+        results['placeholder'] = _info_copy(_PLACEHOLDER_INFO)
         
         # Summary
         available_count = sum(1 for verifier, info in results.items() 
@@ -422,4 +521,13 @@ class VerifierFactory:
             }
         }
         
-        return VerifierFactory.create_verifier('composite', strict_config)
+        return VerifierFactory.create_verifier(VerifierKind.COMPOSITE, strict_config)
+    
+    # verifier_type -> constructor, used by create_verifier()
+    _CONSTRUCTORS = MappingProxyType({
+        VerifierKind.AUTO: _create_best_available,
+        VerifierKind.LANGUAGETOOL: _create_languagetool_verifier,
+        VerifierKind.HEURISTIC: _create_heuristic_verifier,
+        VerifierKind.PLACEHOLDER: _create_placeholder_validator,
+        VerifierKind.COMPOSITE: _create_composite_verifier,
+    })
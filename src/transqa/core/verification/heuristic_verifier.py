@@ -1,8 +1,11 @@
 """Heuristic-based verifier for language leakage and basic rules."""
 
+import functools
 import logging
 import re
-from typing import Dict, List, Optional, Set
+from collections import Counter
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
 from transqa.core.verification.base import BaseVerifier
 from transqa.core.interfaces import TextBlock
@@ -11,6 +14,15 @@ from transqa.models.issue import Issue, IssueType, Severity
 logger = logging.getLogger(__name__)
 
 
+def _index_words_by_language(language_patterns: Dict[str, dict]) -> Dict[str, Tuple[str, ...]]:
+    """Map every vocabulary word to the languages whose word list contains it."""
+    index: Dict[str, List[str]] = {}
+    for lang, patterns in language_patterns.items():
+        for word in patterns['words']:
+            index.setdefault(word, []).append(lang)
+    return {word: tuple(langs) for word, langs in index.items()}
+
+
 class HeuristicVerifier(BaseVerifier):
     """Heuristic verifier for language leakage detection and basic quality rules."""
     
@@ -18,7 +30,7 @@ class HeuristicVerifier(BaseVerifier):
     LANGUAGE_PATTERNS = {
         'es': {
             'chars': re.compile(r'[ñáéíóúüÑÁÉÍÓÚÜ¿¡]'),
-            'words': {'el', 'la', 'de', 'que', 'y', 'en', 'un', 'es', 'se', 'no', 'te', 'lo', 'con', 'para', 'una', 'del', 'todo', 'le', 'da', 'su', 'por', 'son', 'pero', 'esto', 'ya', 'muy', 'hacer', 'como', 'fue', 'ser', 'han', 'cuando', 'hasta', 'más', 'desde'},
+            'words': frozenset({'el', 'la', 'de', 'que', 'y', 'en', 'un', 'es', 'se', 'no', 'te', 'lo', 'con', 'para', 'una', 'del', 'todo', 'le', 'da', 'su', 'por', 'son', 'pero', 'esto', 'ya', 'muy', 'hacer', 'como', 'fue', 'ser', 'han', 'cuando', 'hasta', 'más', 'desde'}),
             'patterns': [
                 re.compile(r'\b(?:el|la|los|las)\s+\w+'),  # Articles
                 re.compile(r'\b\w+(?:ión|ado|ida|mente)\b'),  # Common endings
@@ -26,7 +38,7 @@ class HeuristicVerifier(BaseVerifier):
         },
         'en': {
             'chars': re.compile(r'[a-zA-Z]'),  # No specific chars for English
-            'words': {'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at', 'this', 'but', 'his', 'by', 'from', 'they', 'she', 'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their'},
+            'words': frozenset({'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at', 'this', 'but', 'his', 'by', 'from', 'they', 'she', 'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their'}),
             'patterns': [
                 re.compile(r'\b(?:the|a|an)\s+\w+'),  # Articles
                 re.compile(r'\b\w+(?:ing|ed|ly|tion)\b'),  # Common endings
@@ -34,7 +46,7 @@ class HeuristicVerifier(BaseVerifier):
         },
         'nl': {
             'chars': re.compile(r'[ëïöüÿ]|ij'),
-            'words': {'de', 'het', 'een', 'en', 'van', 'te', 'dat', 'die', 'in', 'is', 'hij', 'niet', 'zijn', 'op', 'aan', 'met', 'als', 'voor', 'had', 'er', 'maar', 'om', 'hem', 'dan', 'zou', 'nu', 'wel', 'nog', 'worden', 'bij', 'onder', 'tegen'},
+            'words': frozenset({'de', 'het', 'een', 'en', 'van', 'te', 'dat', 'die', 'in', 'is', 'hij', 'niet', 'zijn', 'op', 'aan', 'met', 'als', 'voor', 'had', 'er', 'maar', 'om', 'hem', 'dan', 'zou', 'nu', 'wel', 'nog', 'worden', 'bij', 'onder', 'tegen'}),
             'patterns': [
                 re.compile(r'\b(?:de|het)\s+\w+'),  # Articles
                 re.compile(r'\bij\b'),  # Dutch 'ij' digraph
@@ -43,6 +55,20 @@ class HeuristicVerifier(BaseVerifier):
         }
     }
     
+    # word -> languages listing it, so tokens are matched in a single pass
+    WORD_LANGUAGES = _index_words_by_language(LANGUAGE_PATTERNS)
+    
+    # Character sets (and digraphs) behind each 'chars' pattern, tallied from
+    # one character histogram instead of a findall pass per language
+    LANGUAGE_CHARSETS = {
+        'es': frozenset('ñáéíóúüÑÁÉÍÓÚÜ¿¡'),
+        'en': frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'),
+        'nl': frozenset('ëïöüÿ'),
+    }
+    LANGUAGE_DIGRAPHS = {
+        'nl': ('ij',),
+    }
+    
     # Common false positives (technical terms, brand names, etc.)
     FALSE_POSITIVE_PATTERNS = [
         re.compile(r'\b[A-Z]{2,}\b'),  # Acronyms
@@ -52,6 +78,22 @@ class HeuristicVerifier(BaseVerifier):
         re.compile(r'\b(?:API|JSON|XML|HTML|CSS|JS|SQL|HTTP)\b'),  # Technical terms
     ]
     
+    # All false-positive patterns as one alternation, removed in a single pass
+    FALSE_POSITIVE_PATTERN = re.compile('|'.join(f'(?:{p.pattern})' for p in FALSE_POSITIVE_PATTERNS))
+    
+    # Tokenization and rule patterns, compiled once instead of per text block
+    WORD_PATTERN = re.compile(r'\b[a-zA-ZáéíóúüñÁÉÍÓÚÜÑëïöüÿ]{2,}\b')
+    SENTENCE_TERMINATOR_TABLE = str.maketrans('!?', '..')
+    FIRST_WORD_PATTERN = re.compile(r'\S+')
+    TITLE_CASE_PATTERN = re.compile(r'\b[A-Z][A-Z\s]+[A-Z]\b')
+    MISSING_SPACE_PATTERN = re.compile(r'[.!?,:;][a-zA-Z]')
+    MISSING_OPENING_QUESTION_PATTERN = re.compile(r'[^¿]\s*[A-ZÁÉÍÓÚÑÜ][^.!?]*\?')
+    MISSING_OPENING_EXCLAMATION_PATTERN = re.compile(r'[^¡]\s*[A-ZÁÉÍÓÚÑÜ][^.!?]*!')
+    QUOTE_CHARS = '"\''  # quotation marks counted by the consistency check
+    HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+    LOWERCASE_PATTERN = re.compile(r'[a-z]')
+    UPPERCASE_PATTERN = re.compile(r'[A-Z]')
+    
     def __init__(self, config: Optional[dict] = None):
         """Initialize heuristic verifier."""
         super().__init__(config)
@@ -63,7 +105,7 @@ class HeuristicVerifier(BaseVerifier):
         self.check_capitalization = self.config.get('check_capitalization', True)
         
         # Whitelist for terms that might appear to be in wrong language
-        self.whitelist = set(self.config.get('whitelist', [
+        self.whitelist = frozenset(self.config.get('whitelist', [
             # Common technical terms
             'email', 'online', 'website', 'app', 'software', 'hardware',
             'login', 'logout', 'password', 'username', 'admin', 'user',
@@ -73,77 +115,105 @@ class HeuristicVerifier(BaseVerifier):
             # Common borrowed words
             'blog', 'podcast', 'streaming', 'wifi', 'smartphone',
         ]))
+        
+        # Vocabulary index with whitelisted terms removed up front, so the
+        # per-token matching loop is a single dict lookup
+        self._word_languages = {
+            word: langs for word, langs in self.WORD_LANGUAGES.items()
+            if word not in self.whitelist
+        }
+        
+        # Bounded memo of language scores so repeated passes over the same
+        # block (leakage checks, confidence queries) reuse the regex work
+        self._cached_language_scores = functools.lru_cache(
+            maxsize=self.config.get('score_cache_size', 256)
+        )(self._score_languages)
+        
+        # Pages repeat nav items, button labels and boilerplate verbatim, so
+        # whole-text results are memoised too (issues are copied on the way out)
+        self._cached_text_issues = functools.lru_cache(
+            maxsize=self.config.get('result_cache_size', 4096)
+        )(self._check_text)
     
     def _check_impl(self, text: str, target_lang: str, context: Optional[TextBlock] = None) -> List[Issue]:
         """Perform heuristic checks on text."""
+        # Callers annotate and merge issues in place, so never hand out cached ones
+        is_heading = context is not None and context.tag_name in self.HEADING_TAGS
+        cached = self._cached_text_issues(
+            text, target_lang, is_heading, self.leak_threshold, self.min_words_for_detection,
+            self.check_capitalization, self.confidence_boost_patterns
+        )
+        return [issue.model_copy() for issue in cached]
+    
+    def _check_text(
+        self,
+        text: str,
+        target_lang: str,
+        is_heading: bool,
+        leak_threshold: float,
+        min_words: int,
+        check_capitalization: bool,
+        boost_patterns: bool
+    ) -> Tuple[Issue, ...]:
+        """Run every heuristic check on text; memoised by ``_check_impl``.
+        
+        Every setting that affects the result is an argument, so it is part
+        of the memo key and changing it at runtime never returns stale issues.
+        """
         issues = []
         
         # Language leakage detection
-        issues.extend(self._detect_language_leakage(text, target_lang))
+        issues.extend(self._detect_language_leakage(
+            text, target_lang, leak_threshold, min_words, boost_patterns
+        ))
         
         # Capitalization checks
-        if self.check_capitalization:
+        if check_capitalization:
             issues.extend(self._check_capitalization_rules(text, target_lang))
         
         # Punctuation and spacing
         issues.extend(self._check_punctuation_rules(text, target_lang))
         
         # Consistency checks
-        issues.extend(self._check_consistency_issues(text, target_lang))
+        issues.extend(self._check_consistency_issues(text, target_lang, is_heading))
         
-        return issues
+        return tuple(issues)
     
-    def _detect_language_leakage(self, text: str, target_lang: str) -> List[Issue]:
-        """Detect words/phrases in wrong language."""
+    def _detect_language_leakage(
+        self,
+        text: str,
+        target_lang: str,
+        leak_threshold: Optional[float] = None,
+        min_words: Optional[int] = None,
+        boost_patterns: Optional[bool] = None
+    ) -> List[Issue]:
+        """Detect words/phrases in wrong language (settings default to the instance's)."""
+        if leak_threshold is None:
+            leak_threshold = self.leak_threshold
+        if min_words is None:
+            min_words = self.min_words_for_detection
+        if boost_patterns is None:
+            boost_patterns = self.confidence_boost_patterns
+        
         issues = []
         
         if target_lang not in self.LANGUAGE_PATTERNS:
             return issues
         
-        # Tokenize text
-        words = self._extract_words(text)
-        if len(words) < self.min_words_for_detection:
+        # Words are 2+ letters separated by at least one character, so n words
+        # need 3n - 1 characters; bail out on short strings before tokenizing
+        if (len(text) + 1) // 3 < min_words:
             return issues
         
-        # Count language indicators for each language
-        language_scores = {}
-        word_evidence = {}  # Track which words contributed to each language
-        
-        for lang, patterns in self.LANGUAGE_PATTERNS.items():
-            if lang == target_lang:
-                continue  # Skip target language in leakage detection
-            
-            score = 0
-            evidence_words = []
-            
-            # Character-based scoring
-            char_matches = patterns['chars'].findall(text)
-            char_score = len(char_matches) / max(len(text), 1)
-            score += char_score * 0.3
-            
-            # Word-based scoring
-            target_words = patterns['words']
-            matching_words = [word for word in words 
-                            if word.lower() in target_words and word.lower() not in self.whitelist]
-            word_score = len(matching_words) / len(words)
-            score += word_score * 0.5
-            evidence_words.extend(matching_words)
-            
-            # Pattern-based scoring
-            pattern_matches = 0
-            for pattern in patterns['patterns']:
-                pattern_matches += len(pattern.findall(text))
-            pattern_score = pattern_matches / max(len(words), 1)
-            score += pattern_score * 0.2
-            
-            language_scores[lang] = score
-            word_evidence[lang] = evidence_words
+        word_count, language_scores = self._cached_language_scores(
+            text, target_lang, min_words, boost_patterns
+        )
+        if word_count < min_words:
+            return issues
         
         # Check if any language exceeds threshold
-        for lang, score in language_scores.items():
-            if score >= self.leak_threshold:
-                evidence = word_evidence[lang]
-                
+        for lang, (score, evidence) in language_scores.items():
+            if score >= leak_threshold:
                 # Create leakage issue
                 confidence = min(0.95, score * 2)  # Convert score to confidence
                 
@@ -172,41 +242,42 @@ class HeuristicVerifier(BaseVerifier):
         
         return issues
     
+    def _iter_sentences(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield ``(offset, sentence)`` pairs with sentences stripped of whitespace."""
+        # Sentences end at runs of '.', '!' or '?': runs give empty pieces and
+        # whitespace after a terminator is stripped from the next sentence
+        pos = 0
+        for segment in text.translate(self.SENTENCE_TERMINATOR_TABLE).split('.'):
+            sentence = segment.strip()
+            if sentence:
+                yield pos + len(segment) - len(segment.lstrip()), sentence
+            pos += len(segment) + 1
+    
     def _check_capitalization_rules(self, text: str, target_lang: str) -> List[Issue]:
         """Check language-specific capitalization rules."""
         issues = []
         
         # Check sentence capitalization
-        sentences = re.split(r'[.!?]+\s*', text)
-        for i, sentence in enumerate(sentences):
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-            
+        for sentence_start, sentence in self._iter_sentences(text):
             # Check if sentence starts with lowercase (excluding special cases)
-            first_word = sentence.split()[0] if sentence.split() else ''
-            if (first_word and 
-                first_word[0].islower() and 
+            first_word = self.FIRST_WORD_PATTERN.match(sentence).group()
+            if (first_word[0].islower() and
                 not self._is_capitalization_exception(first_word, target_lang)):
                 
-                # Find position in original text
-                sentence_start = text.find(sentence)
-                if sentence_start != -1:
-                    issue = self._create_issue(
-                        IssueType.CAPITALIZATION,
-                        f"Sentence should start with capital letter: '{first_word}'",
-                        text, sentence_start, sentence_start + len(first_word), target_lang,
-                        suggestion=first_word.capitalize(),
-                        rule_id="SENTENCE_CAPITALIZATION",
-                        confidence=0.7
-                    )
-                    issues.append(issue)
+                issue = self._create_issue(
+                    IssueType.CAPITALIZATION,
+                    f"Sentence should start with capital letter: '{first_word}'",
+                    text, sentence_start, sentence_start + len(first_word), target_lang,
+                    suggestion=first_word.capitalize(),
+                    rule_id="SENTENCE_CAPITALIZATION",
+                    confidence=0.7
+                )
+                issues.append(issue)
         
         # Language-specific capitalization rules
         if target_lang == 'en':
             # Check title case for potential headings (all caps words)
-            title_case_pattern = re.compile(r'\b[A-Z][A-Z\s]+[A-Z]\b')
-            for match in title_case_pattern.finditer(text):
+            for match in self.TITLE_CASE_PATTERN.finditer(text):
                 if len(match.group().split()) > 1:  # Multiple words
                     suggestion = ' '.join(word.capitalize() for word in match.group().lower().split())
                     issue = self._create_issue(
@@ -226,8 +297,7 @@ class HeuristicVerifier(BaseVerifier):
         issues = []
         
         # Check for missing spaces after punctuation
-        missing_space_pattern = re.compile(r'[.!?,:;][a-zA-Z]')
-        for match in missing_space_pattern.finditer(text):
+        for match in self.MISSING_SPACE_PATTERN.finditer(text):
             issue = self._create_issue(
                 IssueType.PUNCTUATION,
                 f"Missing space after punctuation: '{match.group()}'",
@@ -240,9 +310,12 @@ class HeuristicVerifier(BaseVerifier):
         
         # Language-specific punctuation rules
         if target_lang == 'es':
-            # Check for missing opening question/exclamation marks
-            missing_opening_q = re.compile(r'[^¿]\s*[A-ZÁÉÍÓÚÑÜ][^.!?]*\?')
-            for match in missing_opening_q.finditer(text):
+            # Check for missing opening question/exclamation marks; each scan
+            # needs its closing mark, so skip it when the mark is absent
+            question_matches = (
+                self.MISSING_OPENING_QUESTION_PATTERN.finditer(text) if '?' in text else ()
+            )
+            for match in question_matches:
                 issue = self._create_issue(
                     IssueType.PUNCTUATION,
                     "Spanish question missing opening ¿",
@@ -253,8 +326,10 @@ class HeuristicVerifier(BaseVerifier):
                 )
                 issues.append(issue)
             
-            missing_opening_e = re.compile(r'[^¡]\s*[A-ZÁÉÍÓÚÑÜ][^.!?]*!')
-            for match in missing_opening_e.finditer(text):
+            exclamation_matches = (
+                self.MISSING_OPENING_EXCLAMATION_PATTERN.finditer(text) if '!' in text else ()
+            )
+            for match in exclamation_matches:
                 issue = self._create_issue(
                     IssueType.PUNCTUATION,
                     "Spanish exclamation missing opening ¡",
@@ -267,18 +342,18 @@ class HeuristicVerifier(BaseVerifier):
         
         return issues
     
-    def _check_consistency_issues(self, text: str, target_lang: str) -> List[Issue]:
+    def _check_consistency_issues(self, text: str, target_lang: str, is_heading: bool = False) -> List[Issue]:
         """Check for general consistency issues."""
         issues = []
         
-        # Check for inconsistent quotation marks
-        quotes = re.findall(r'[""\'\'"\']', text)
-        if len(quotes) >= 4:  # At least 2 pairs
-            quote_types = set(quotes)
+        # Check for inconsistent quotation marks (C-level counts per quote char)
+        quote_counts = [(quote, text.count(quote)) for quote in self.QUOTE_CHARS]
+        if sum(count for _, count in quote_counts) >= 4:  # At least 2 pairs
+            quote_types = [quote for quote, count in quote_counts if count]
             if len(quote_types) > 2:  # More than 2 different quote types
                 issue = self._create_issue(
                     IssueType.CONSISTENCY,
-                    f"Inconsistent quotation marks: {', '.join(sorted(quote_types))}",
+                    f"Inconsistent quotation marks: {', '.join(quote_types)}",
                     text, 0, len(text), target_lang,
                     suggestion="Use consistent quotation mark style",
                     rule_id="INCONSISTENT_QUOTES",
@@ -287,29 +362,125 @@ class HeuristicVerifier(BaseVerifier):
                 issues.append(issue)
         
         # Check for mixed case in what appears to be a title/heading
-        if context and context.tag_name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            if re.search(r'[a-z].*[A-Z]|[A-Z].*[a-z].*[A-Z]', text):
-                issue = self._create_issue(
-                    IssueType.CAPITALIZATION,
-                    "Inconsistent capitalization in heading",
-                    text, 0, len(text), target_lang,
-                    suggestion="Use consistent title case or sentence case",
-                    rule_id="INCONSISTENT_HEADING_CASE",
-                    confidence=0.4
-                )
-                issues.append(issue)
+        if is_heading and self._has_mixed_case(text):
+            issue = self._create_issue(
+                IssueType.CAPITALIZATION,
+                "Inconsistent capitalization in heading",
+                text, 0, len(text), target_lang,
+                suggestion="Use consistent title case or sentence case",
+                rule_id="INCONSISTENT_HEADING_CASE",
+                confidence=0.4
+            )
+            issues.append(issue)
         
         return issues
     
+    def _has_mixed_case(self, text: str) -> bool:
+        """Whether text mixes case like ``[a-z].*[A-Z]|[A-Z].*[a-z].*[A-Z]``.
+        
+        The second alternative implies the first, so this looks for a lowercase
+        letter followed by an uppercase one on the same line (``.`` stops at
+        newlines), in linear time instead of the regex's quadratic backtracking.
+        """
+        lower = self.LOWERCASE_PATTERN.search(text)
+        while lower:
+            line_end = text.find('\n', lower.end())
+            if line_end == -1:
+                return self.UPPERCASE_PATTERN.search(text, lower.end()) is not None
+            if self.UPPERCASE_PATTERN.search(text, lower.end(), line_end):
+                return True
+            lower = self.LOWERCASE_PATTERN.search(text, line_end + 1)
+        return False
+    
+    def _score_languages(
+        self, text: str, skip_lang: Optional[str] = None, min_words: int = 1, boost_patterns: bool = True
+    ) -> Tuple[int, Mapping[str, Tuple[float, Tuple[str, ...]]]]:
+        """Score how strongly text resembles each known language.
+        
+        Args:
+            text: Text to score
+            skip_lang: Language to leave out of the scores (usually the target)
+            min_words: Minimum word count below which scoring is skipped
+            boost_patterns: Whether grammatical patterns add to the score
+            
+        Returns:
+            Tuple of (word count, read-only mapping of language to
+            (score, matching words))
+        """
+        words = self._extract_words(text)
+        if not words or len(words) < min_words:
+            return len(words), MappingProxyType({})
+        
+        # Count each distinct word once and bucket it by language in one pass
+        word_matches = self._match_language_words(Counter(words))
+        char_counts = Counter(text)
+        
+        language_scores = {}
+        for lang, patterns in self.LANGUAGE_PATTERNS.items():
+            if lang == skip_lang:
+                continue
+            
+            score = 0
+            
+            # Character-based scoring
+            char_matches = self._count_language_chars(lang, text, char_counts)
+            char_score = char_matches / max(len(text), 1)
+            score += char_score * 0.3
+            
+            # Word-based scoring
+            matched, matching_words = word_matches.get(lang, (0, []))
+            word_score = matched / len(words)
+            score += word_score * 0.5
+            
+            # Pattern-based scoring (optional boost; the scans are the costly part)
+            if boost_patterns:
+                pattern_matches = 0
+                for pattern in patterns['patterns']:
+                    pattern_matches += len(pattern.findall(text))
+                pattern_score = pattern_matches / max(len(words), 1)
+                score += pattern_score * 0.2
+            
+            language_scores[lang] = (score, tuple(matching_words))
+        
+        return len(words), MappingProxyType(language_scores)
+    
+    def _count_language_chars(self, lang: str, text: str, char_counts: Counter) -> int:
+        """Count characteristic characters of a language from a character histogram."""
+        charset = self.LANGUAGE_CHARSETS[lang]
+        total = sum(count for char, count in char_counts.items() if char in charset)
+        for digraph in self.LANGUAGE_DIGRAPHS.get(lang, ()):
+            total += text.count(digraph)
+        return total
+    
+    def _match_language_words(self, word_counts: Counter) -> Dict[str, list]:
+        """Bucket non-whitelisted vocabulary words by language in one pass.
+        
+        Returns:
+            Dictionary mapping language to [token count, distinct words in first-seen order]
+        """
+        matches = {}
+        word_languages = self._word_languages
+        for word, count in word_counts.items():
+            langs = word_languages.get(word)
+            if langs is None:
+                continue
+            for lang in langs:
+                entry = matches.get(lang)
+                if entry is None:
+                    matches[lang] = [count, [word]]
+                else:
+                    entry[0] += count
+                    entry[1].append(word)
+        return matches
+    
     def _extract_words(self, text: str) -> List[str]:
-        """Extract alphabetic words from text."""
-        # Filter out false positives first
-        filtered_text = text
-        for pattern in self.FALSE_POSITIVE_PATTERNS:
-            filtered_text = pattern.sub(' ', filtered_text)
-        
-        # Extract words (only alphabetic, minimum length 2)
-        words = re.findall(r'\b[a-zA-ZáéíóúüñÁÉÍÓÚÜÑëïöüÿ]{2,}\b', filtered_text)
+        """Extract lowercased alphabetic words from text."""
+        # Filter out false positives first (acronym detection needs the original case)
+        filtered_text = self.FALSE_POSITIVE_PATTERN.sub(' ', text)
+        
+        # Extract words (only alphabetic, minimum length 2), lowercasing the
+        # whole text once rather than every token in every consumer
+        words = self.WORD_PATTERN.findall(filtered_text.lower())
         return words
     
     def _is_capitalization_exception(self, word: str, target_lang: str) -> bool:
@@ -330,50 +501,21 @@ class HeuristicVerifier(BaseVerifier):
         context: Optional[TextBlock] = None
     ) -> List[Issue]:
         """Detect language leakage with custom threshold."""
-        if threshold is not None:
-            original_threshold = self.leak_threshold
-            self.leak_threshold = threshold
-            
-            issues = self._detect_language_leakage(text, target_lang)
-            
-            self.leak_threshold = original_threshold  # Restore original
-            return issues
-        
-        return self._detect_language_leakage(text, target_lang)
+        return self._detect_language_leakage(text, target_lang, threshold)
     
     def get_language_confidence(self, text: str, target_lang: str) -> Dict[str, float]:
         """Get confidence scores for each language."""
         if target_lang not in self.LANGUAGE_PATTERNS:
             return {}
         
-        words = self._extract_words(text)
-        if not words:
+        word_count, language_scores = self._cached_language_scores(
+            text, None, 1, self.confidence_boost_patterns
+        )
+        if not word_count:
             return {}
         
         confidence_scores = {}
-        
-        for lang, patterns in self.LANGUAGE_PATTERNS.items():
-            score = 0
-            
-            # Character-based evidence
-            char_matches = patterns['chars'].findall(text)
-            char_score = len(char_matches) / max(len(text), 1)
-            score += char_score * 0.3
-            
-            # Word-based evidence
-            target_words = patterns['words']
-            matching_words = [word for word in words 
-                            if word.lower() in target_words and word.lower() not in self.whitelist]
-            word_score = len(matching_words) / len(words) if words else 0
-            score += word_score * 0.5
-            
-            # Pattern-based evidence
-            pattern_matches = 0
-            for pattern in patterns['patterns']:
-                pattern_matches += len(pattern.findall(text))
-            pattern_score = pattern_matches / max(len(words), 1)
-            score += pattern_score * 0.2
-            
+        for lang, (score, _) in language_scores.items():
             confidence_scores[lang] = min(1.0, score * 2)  # Scale to 0-1
         
         return confidence_scores
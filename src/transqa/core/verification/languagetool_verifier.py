@@ -1,8 +1,14 @@
 """LanguageTool-based verifier for grammar, spelling, and style."""
 
+import bisect
 import logging
+import re
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 from transqa.core.verification.base import BaseVerifier
 from transqa.core.interfaces import TextBlock, VerificationError
@@ -17,6 +23,13 @@ except ImportError:
     LANGUAGETOOL_AVAILABLE = False
     ltp = None
 
+try:
+    import blingfire
+    BLINGFIRE_AVAILABLE = True
+except ImportError:
+    BLINGFIRE_AVAILABLE = False
+    blingfire = None
+
 
 class LanguageToolVerifier(BaseVerifier):
     """Verifier using LanguageTool for grammar, spelling, and style checking."""
@@ -41,6 +54,58 @@ class LanguageToolVerifier(BaseVerifier):
         'MISC': IssueType.GRAMMAR,
     }
     
+    # Severity per category; other categories fall back to the match priority
+    SEVERITY_BY_CATEGORY = {
+        'TYPOS': Severity.ERROR,  # Critical spelling errors
+        'GRAMMAR': Severity.WARNING,
+        'STYLE': Severity.INFO,
+        'TYPOGRAPHY': Severity.INFO,
+        'REPETITION': Severity.INFO,
+        'REDUNDANCY': Severity.INFO,
+        'PUNCTUATION': Severity.WARNING,
+        'CASING': Severity.WARNING,  # Capitalization
+    }
+    
+    # Warm-up texts with typical grammar, spelling, punctuation and typography
+    # errors, checked on initialize() so the first real block doesn't pay for
+    # loading the language's rules and dictionaries
+    WARMUP_TEXTS = {
+        'es': (
+            "Este es un texto de prueva para calentar el corrector. "
+            "Los niño juega en el parque , y la casa es muy grande grande. "
+            "que hora es? Hay 3 manzanas ,2 peras y un  melon."
+        ),
+        'en': (
+            "This is a sample text to warm up the checker. "
+            "The childs was playing in the park , and their house are very big big. "
+            "what time is it? There are 3 apples ,2 pears and a  melon."
+        ),
+        'nl': (
+            "Dit is een voorbeeld tekst om de controle op te warmen. "
+            "De kinderen speelt in het park , en het huis zijn heel groot groot. "
+            "hoe laat is het? Er zijn 3 appels ,2 peren en een  meloen."
+        ),
+    }
+    
+    # Categories switched off for the single-purpose checks (check_grammar etc.)
+    PRESET_DISABLED_CATEGORIES = {
+        'grammar': frozenset({'TYPOS', 'STYLE', 'TYPOGRAPHY', 'REPETITION', 'REDUNDANCY'}),
+        'spelling': frozenset({
+            'GRAMMAR', 'STYLE', 'TYPOGRAPHY', 'PUNCTUATION', 'REPETITION', 'REDUNDANCY', 'CASING'
+        }),
+        'style': frozenset({'GRAMMAR', 'TYPOS', 'PUNCTUATION', 'CASING'}),
+    }
+    
+    # Cheap signals that a text is worth a LanguageTool round-trip when the
+    # fast_path option is on: repeated words, shouting/acronyms, long digit runs
+    SUSPICIOUS_TEXT_PATTERN = re.compile(r'(?i:\b(\w+)\s+\1\b)|[A-Z]{4,}|\d{5,}')
+    
+    # Sentence endings used to chunk texts longer than max_text_length
+    SENTENCE_END_PATTERN = re.compile(r'[.!?]+\s*')
+    
+    # Rare sentinel paragraph placed between texts coalesced into one request
+    BATCH_SEPARATOR = '\n\n§§§TQA_SEP§§§\n\n'
+    
     def __init__(self, config: Optional[dict] = None):
         """Initialize LanguageTool verifier."""
         if not LANGUAGETOOL_AVAILABLE:
@@ -57,51 +122,50 @@ class LanguageToolVerifier(BaseVerifier):
         self.max_text_length = self.config.get('max_text_length', 20000)
         
         # Rule configuration
-        self.disabled_rules = set(self.config.get('disabled_rules', []))
-        self.enabled_rules = set(self.config.get('enabled_rules', []))
-        self.disabled_categories = set(self.config.get('disabled_categories', []))
+        self.disabled_rules = frozenset(self.config.get('disabled_rules', []))
+        self.enabled_rules = frozenset(self.config.get('enabled_rules', []))
+        self.disabled_categories = frozenset(self.config.get('disabled_categories', []))
         
         # Performance settings
         self.cache_enabled = self.config.get('cache_enabled', True)
+        self.cache_size = self.config.get('cache_size', 4096)
         self.batch_size = self.config.get('batch_size', 10)
+        self.max_workers = self.config.get('max_workers', 4)
+        self.fast_path = self.config.get('fast_path', False)
+        self.warmup = self.config.get('warmup', True)
         
         # Language tool instances (per language)
         self._tools: Dict[str, any] = {}
         self._initialization_errors: Dict[str, str] = {}
+        
+        # Tools with a category preset applied, keyed by (language, preset) and
+        # created on first use, so preset checks never reconfigure shared tools
+        self._preset_tools: Dict[Tuple[str, str], any] = {}
+        self._preset_tools_lock = threading.Lock()
+        
+        # Worker pool overlapping blocking LanguageTool requests, created on initialize()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # LRU of issues per checked text, shared by the worker threads
+        self._result_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def initialize(self) -> None:
         """Initialize LanguageTool instances for supported languages."""
         super().initialize()
         
-        for transqa_lang, lt_lang in self.LANGUAGE_CODES.items():
+        # Languages start independently, so connect and warm them up in parallel
+        with ThreadPoolExecutor(
+            max_workers=len(self.LANGUAGE_CODES), thread_name_prefix="transqa-languagetool-init"
+        ) as executor:
+            futures = {
+                transqa_lang: executor.submit(self._initialize_language, transqa_lang, lt_lang)
+                for transqa_lang, lt_lang in self.LANGUAGE_CODES.items()
+            }
+        
+        for transqa_lang, future in futures.items():
             try:
-                logger.info(f"Initializing LanguageTool for {transqa_lang} ({lt_lang})...")
-                
-                # Configure LanguageTool
-                config_options = {}
-                if self.local_server:
-                    # Use local server if configured
-                    tool = ltp.LanguageToolPublicAPI(lt_lang)
-                else:
-                    # Use remote server
-                    tool = ltp.LanguageToolPublicAPI(lt_lang, host=self.server_url)
-                
-                # Apply rule configurations
-                if self.disabled_rules:
-                    tool.disabled_rules = list(self.disabled_rules)
-                
-                if self.enabled_rules:
-                    tool.enabled_rules = list(self.enabled_rules)
-                
-                if self.disabled_categories:
-                    tool.disabled_categories = list(self.disabled_categories)
-                
-                # Test the connection
-                test_result = tool.check("Test.")
-                logger.info(f"LanguageTool {transqa_lang} initialized successfully")
-                
-                self._tools[transqa_lang] = tool
-            
+                self._tools[transqa_lang] = future.result()
             except Exception as e:
                 error_msg = f"Failed to initialize LanguageTool for {transqa_lang}: {e}"
                 logger.error(error_msg)
@@ -112,13 +176,76 @@ class LanguageToolVerifier(BaseVerifier):
                 f"No LanguageTool instances could be initialized. Errors: {self._initialization_errors}"
             )
         
+        if self.max_workers > 1 and self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="transqa-languagetool"
+            )
+        
         logger.info(f"LanguageTool verifier initialized for languages: {list(self._tools.keys())}")
     
+    def _initialize_language(self, transqa_lang: str, lt_lang: str):
+        """Create, test and warm up the LanguageTool instance for one language."""
+        logger.info(f"Initializing LanguageTool for {transqa_lang} ({lt_lang})...")
+        
+        tool = self._create_tool(lt_lang)
+        
+        # Test the connection; with warm-up on, exercise the main rule categories
+        if self.warmup:
+            tool.check(self.WARMUP_TEXTS.get(transqa_lang, "Test."))
+        else:
+            tool.check("Test.")
+        logger.info(f"LanguageTool {transqa_lang} initialized successfully")
+        
+        return tool
+    
+    def _create_tool(self, lt_lang: str, extra_disabled_categories: frozenset = frozenset()):
+        """Create a LanguageTool instance with the configured rule filters."""
+        if self.local_server:
+            # Use local server if configured
+            tool = ltp.LanguageToolPublicAPI(lt_lang)
+        else:
+            # Use remote server
+            tool = ltp.LanguageToolPublicAPI(lt_lang, host=self.server_url)
+        
+        # Apply rule configurations
+        if self.disabled_rules:
+            tool.disabled_rules = sorted(self.disabled_rules)
+        
+        if self.enabled_rules:
+            tool.enabled_rules = sorted(self.enabled_rules)
+        
+        disabled_categories = self.disabled_categories | extra_disabled_categories
+        if disabled_categories:
+            tool.disabled_categories = sorted(disabled_categories)
+        
+        return tool
+    
+    def _get_tool(self, target_lang: str, preset: Optional[str] = None):
+        """Get the tool for a language, optionally with a category preset applied."""
+        if preset is None:
+            return self._tools[target_lang]
+        
+        key = (target_lang, preset)
+        tool = self._preset_tools.get(key)
+        if tool is None:
+            with self._preset_tools_lock:
+                tool = self._preset_tools.get(key)
+                if tool is None:
+                    tool = self._create_tool(
+                        self.LANGUAGE_CODES[target_lang], self.PRESET_DISABLED_CATEGORIES[preset]
+                    )
+                    self._preset_tools[key] = tool
+        return tool
+    
     def cleanup(self) -> None:
         """Cleanup LanguageTool resources."""
         super().cleanup()
         
-        for lang, tool in self._tools.items():
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        for lang, tool in [*self._tools.items(), *self._preset_tools.items()]:
             try:
                 if hasattr(tool, 'close'):
                     tool.close()
@@ -127,20 +254,34 @@ class LanguageToolVerifier(BaseVerifier):
                 logger.warning(f"Error closing LanguageTool for {lang}: {e}")
         
         self._tools.clear()
+        self._preset_tools.clear()
         self._initialization_errors.clear()
+        with self._cache_lock:
+            self._result_cache.clear()
     
-    def _check_impl(self, text: str, target_lang: str, context: Optional[TextBlock] = None) -> List[Issue]:
-        """Check text using LanguageTool."""
+    def _check_impl(
+        self, text: str, target_lang: str, context: Optional[TextBlock] = None, preset: Optional[str] = None
+    ) -> List[Issue]:
+        """Check text using LanguageTool, optionally with a category preset."""
         if target_lang not in self._tools:
             logger.warning(f"LanguageTool not available for language: {target_lang}")
             return []
         
-        # Split long text if needed
+        if self.fast_path and self._likely_clean(text):
+            return []
+        
+        # Split long text if needed (its chunks are cached individually)
         if len(text) > self.max_text_length:
-            return self._check_long_text(text, target_lang, context)
+            return self._check_long_text(text, target_lang, context, preset)
+        
+        cache_key = self._cache_key(text, target_lang, preset) if self.cache_enabled else None
+        if cache_key is not None:
+            cached = self._get_cached_issues(cache_key)
+            if cached is not None:
+                return cached
         
         try:
-            tool = self._tools[target_lang]
+            tool = self._get_tool(target_lang, preset)
             
             # Perform check
             start_time = time.time()
@@ -150,146 +291,347 @@ class LanguageToolVerifier(BaseVerifier):
             logger.debug(f"LanguageTool check completed in {check_time:.2f}s, found {len(matches)} matches")
             
             # Convert matches to issues
-            issues = []
-            for match in matches:
-                issue = self._convert_match_to_issue(match, text, target_lang)
-                if issue:
-                    issues.append(issue)
-            
-            return issues
+            issues = self._convert_matches(matches, text, target_lang)
         
         except Exception as e:
             logger.error(f"LanguageTool check failed for {target_lang}: {e}")
             return []
-    
-    def _check_long_text(self, text: str, target_lang: str, context: Optional[TextBlock] = None) -> List[Issue]:
-        """Check long text by splitting into chunks."""
-        issues = []
         
-        # Split text into sentences approximately
-        sentences = self._split_into_sentences(text)
-        
-        current_chunk = ""
-        current_offset = 0
+        if cache_key is not None:
+            self._store_cached_issues(cache_key, issues)
+        return issues
+    
+    def _likely_clean(self, text: str) -> bool:
+        """Whether the fast path may skip LanguageTool for text.
         
-        for sentence in sentences:
-            # Add sentence to current chunk
-            test_chunk = current_chunk + " " + sentence if current_chunk else sentence
+        This is a heuristic: texts without any suspicious signal are assumed
+        clean, so plain misspellings in them go unreported.
+        """
+        return self.SUSPICIOUS_TEXT_PATTERN.search(text) is None
+    
+    @staticmethod
+    def _cache_key(
+        text: str, target_lang: str, preset: Optional[str] = None, coalesced: bool = False
+    ) -> tuple:
+        """Build the result cache key for text checked with a (language, preset) tool."""
+        # Rule filters are fixed when a tool is created, so the tool identity
+        # stands in for them. Coalesced requests let cross-paragraph rules see
+        # neighbouring texts, so their results never answer a single-text check
+        return (target_lang, preset, coalesced, text)
+    
+    def _get_cached_issues(self, key: tuple) -> Optional[List[Issue]]:
+        """Return copies of the cached issues for key, or None on a miss."""
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is None:
+                return None
+            self._result_cache.move_to_end(key)
+        # Callers adjust offsets, severities and context in place
+        return [issue.model_copy() for issue in cached]
+    
+    def _store_cached_issues(self, key: tuple, issues: List[Issue]) -> None:
+        """Cache copies of issues under key, evicting the least recently used entry."""
+        snapshot = tuple(issue.model_copy() for issue in issues)
+        with self._cache_lock:
+            self._result_cache[key] = snapshot
+            self._result_cache.move_to_end(key)
+            if len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+    
+    def _check_impl_batch(
+        self, texts: List[str], target_lang: str, contexts: List[Optional[TextBlock]]
+    ) -> List[List[Issue]]:
+        """Check several texts, coalescing short ones into shared LanguageTool requests."""
+        if target_lang not in self._tools or self.batch_size <= 1:
+            return super()._check_impl_batch(texts, target_lang, contexts)
+        
+        results: List[List[Issue]] = [[] for _ in texts]
+        
+        # Serve repeated texts from the result cache and send each distinct
+        # text only once per batch
+        pending: List[int] = []
+        duplicates: List[Tuple[int, int]] = []
+        first_index: Dict[str, int] = {}
+        for i, text in enumerate(texts):
+            if text in first_index:
+                duplicates.append((i, first_index[text]))
+                continue
+            first_index[text] = i
             
-            if len(test_chunk) <= self.max_text_length:
-                current_chunk = test_chunk
+            if self.fast_path and self._likely_clean(text):
+                continue
+            
+            cached = None
+            if self.cache_enabled and len(text) <= self.max_text_length:
+                cached = self._get_cached_issues(self._cache_key(text, target_lang))
+                if cached is None:
+                    cached = self._get_cached_issues(self._cache_key(text, target_lang, coalesced=True))
+            if cached is None:
+                pending.append(i)
             else:
-                # Process current chunk
-                if current_chunk:
-                    chunk_issues = self._check_impl(current_chunk, target_lang, context)
-                    # Adjust offsets for chunk issues
-                    for issue in chunk_issues:
-                        issue.offset_start += current_offset
-                        issue.offset_end += current_offset
-                    issues.extend(chunk_issues)
-                
-                # Start new chunk with current sentence
-                current_offset += len(current_chunk) + (1 if current_chunk else 0)
-                current_chunk = sentence
-        
-        # Process final chunk
-        if current_chunk:
-            chunk_issues = self._check_impl(current_chunk, target_lang, context)
-            for issue in chunk_issues:
-                issue.offset_start += current_offset
-                issue.offset_end += current_offset
-            issues.extend(chunk_issues)
-        
-        return issues
+                results[i] = cached
+        
+        # Group texts into requests of at most batch_size texts and
+        # max_text_length characters; long texts go alone and keep their chunking
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_length = 0
+        separator_length = len(self.BATCH_SEPARATOR)
+        for i in pending:
+            text = texts[i]
+            if len(text) > self.max_text_length:
+                batches.append([i])
+                continue
+            
+            added_length = len(text) + (separator_length if current else 0)
+            if current and (len(current) >= self.batch_size or
+                            current_length + added_length > self.max_text_length):
+                batches.append(current)
+                current, current_length = [], 0
+                added_length = len(text)
+            current.append(i)
+            current_length += added_length
+        if current:
+            batches.append(current)
+        
+        # Requests are independent and block on HTTP, so overlap them when a pool exists
+        check_request = partial(self._check_request, texts=texts, target_lang=target_lang, contexts=contexts)
+        run = self._executor.map if self._executor is not None and len(batches) > 1 else map
+        for batch, batch_issues in zip(batches, run(check_request, batches)):
+            for i, issues in zip(batch, batch_issues):
+                results[i] = issues
+        
+        for i, first in duplicates:
+            results[i] = [issue.model_copy() for issue in results[first]]
+        
+        return results
+    
+    def _check_request(
+        self, batch: List[int], texts: List[str], target_lang: str, contexts: List[Optional[TextBlock]]
+    ) -> List[List[Issue]]:
+        """Check the texts at the given indices with one LanguageTool request."""
+        if len(batch) == 1:
+            i = batch[0]
+            return [self._check_impl(texts[i], target_lang, contexts[i])]
+        return self._check_coalesced([texts[i] for i in batch], target_lang)
     
-    def _split_into_sentences(self, text: str) -> List[str]:
-        """Split text into sentences for chunking."""
-        # Simple sentence splitting - could be enhanced with proper sentence tokenization
-        import re
+    def check_many(self, items: List[Tuple[str, str]]) -> List[List[Issue]]:
+        """Check several ``(text, target_lang)`` pairs.
         
-        # Split on sentence endings, but preserve the punctuation
-        sentences = re.split(r'([.!?]+\s*)', text)
+        Texts are grouped per language and each group goes through
+        ``check_batch``, whose requests run on the worker pool.
         
-        # Recombine sentence parts
-        result = []
-        for i in range(0, len(sentences) - 1, 2):
-            sentence = sentences[i]
-            if i + 1 < len(sentences):
-                sentence += sentences[i + 1]
-            
-            if sentence.strip():
-                result.append(sentence.strip())
+        Returns:
+            One list of detected issues per item, in input order
+        """
+        results: List[List[Issue]] = [[] for _ in items]
         
-        # Handle case where text doesn't end with punctuation
-        if sentences and not sentences[-1].strip().endswith(('.', '!', '?')):
-            result.append(sentences[-1].strip())
+        by_lang: Dict[str, List[int]] = {}
+        for i, (_, target_lang) in enumerate(items):
+            by_lang.setdefault(target_lang, []).append(i)
+        
+        # Languages run one after another: their requests already share the
+        # pool, and waiting on the pool from inside it could deadlock
+        for target_lang, indices in by_lang.items():
+            lang_issues = self.check_batch([items[i][0] for i in indices], target_lang)
+            for i, issues in zip(indices, lang_issues):
+                results[i] = issues
         
-        return [s for s in result if s]
+        return results
     
-    def _convert_match_to_issue(self, match, text: str, target_lang: str) -> Optional[Issue]:
-        """Convert LanguageTool match to TransQA Issue."""
+    def _check_coalesced(self, texts: List[str], target_lang: str) -> List[List[Issue]]:
+        """Check several short texts with a single LanguageTool request.
+        
+        Texts are joined with BATCH_SEPARATOR and each match is mapped back to
+        the text it falls in; matches reaching into a separator are dropped.
+        Results are cached apart from single-text checks.
+        """
+        results: List[List[Issue]] = [[] for _ in texts]
+        
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(self.BATCH_SEPARATOR)
+        
         try:
-            # Determine issue type from category
-            category = getattr(match, 'category', 'MISC')
-            issue_type = self.CATEGORY_MAPPING.get(category, IssueType.GRAMMAR)
-            
-            # Get message and suggestion
-            message = getattr(match, 'message', 'LanguageTool issue')
-            suggestions = getattr(match, 'replacements', [])
-            suggestion = suggestions[0] if suggestions else None
-            
-            # Get position information
-            offset = getattr(match, 'offset', 0)
-            length = getattr(match, 'length', 1)
-            
-            # Get rule information
-            rule_id = getattr(match, 'ruleId', 'UNKNOWN_RULE')
-            
-            # Determine severity based on rule category and specific rules
-            severity = self._determine_severity(match, category, rule_id)
+            start_time = time.time()
+            matches = self._tools[target_lang].check(self.BATCH_SEPARATOR.join(texts))
+            check_time = time.time() - start_time
             
-            # Create issue
-            issue = Issue(
-                type=issue_type,
-                severity=severity,
-                message=message,
-                suggestion=suggestion,
-                target_lang=target_lang,
-                snippet=text[offset:offset + length],
-                xpath="/",  # Will be updated by caller if context available
-                offset_start=offset,
-                offset_end=offset + length,
-                rule_id=rule_id,
-                confidence=self._calculate_confidence(match)
+            logger.debug(
+                f"LanguageTool batch check of {len(texts)} texts completed in {check_time:.2f}s, "
+                f"found {len(matches)} matches"
             )
+        except Exception as e:
+            logger.error(f"LanguageTool batch check failed for {target_lang}: {e}")
+            return results
+        
+        # Route matches to the text they fall in, then convert each group at once
+        text_matches: List[list] = [[] for _ in texts]
+        for match in matches:
+            match_offset = getattr(match, 'offset', 0)
+            index = bisect.bisect_right(starts, match_offset) - 1
+            if match_offset + self._match_length(match) > starts[index] + len(texts[index]):
+                continue
+            text_matches[index].append(match)
+        
+        for index, group in enumerate(text_matches):
+            if group:
+                results[index] = self._convert_matches(group, texts[index], target_lang, starts[index])
+        
+        if self.cache_enabled:
+            for text, issues in zip(texts, results):
+                self._store_cached_issues(self._cache_key(text, target_lang, coalesced=True), issues)
+        
+        return results
+    
+    def _check_long_text(
+        self, text: str, target_lang: str, context: Optional[TextBlock] = None, preset: Optional[str] = None
+    ) -> List[Issue]:
+        """Check long text by splitting it into chunks of whole sentences."""
+        issues = []
+        limit = self.max_text_length
+        
+        # Chunks are slices of text, so issue offsets only need shifting by the
+        # chunk start to be exact (whitespace between sentences may be skipped)
+        chunk_start = chunk_end = 0
+        for start, end in self._split_into_sentences(text):
+            if end - chunk_start <= limit:
+                chunk_end = end
+                continue
             
-            return issue
+            if chunk_end > chunk_start:
+                issues.extend(self._check_chunk(text, chunk_start, chunk_end, target_lang, context, preset))
+            chunk_start = start
+            
+            # A single sentence over the limit is cut at whitespace where possible
+            while end - chunk_start > limit:
+                cut = text.rfind(' ', chunk_start + 1, chunk_start + limit)
+                if cut == -1:
+                    cut = chunk_start + limit
+                issues.extend(self._check_chunk(text, chunk_start, cut, target_lang, context, preset))
+                chunk_start = cut
+            chunk_end = end
+        
+        if chunk_end > chunk_start:
+            issues.extend(self._check_chunk(text, chunk_start, chunk_end, target_lang, context, preset))
         
-        except Exception as e:
-            logger.warning(f"Error converting LanguageTool match: {e}")
-            return None
+        return issues
     
-    def _determine_severity(self, match, category: str, rule_id: str) -> Severity:
-        """Determine severity for a LanguageTool match."""
-        # Check for critical spelling errors
-        if category == 'TYPOS':
-            return Severity.ERROR
+    def _check_chunk(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        target_lang: str,
+        context: Optional[TextBlock] = None,
+        preset: Optional[str] = None
+    ) -> List[Issue]:
+        """Check ``text[start:end]`` and shift issue offsets back into text."""
+        chunk = text[start:end]
+        if not chunk.strip():
+            return []
         
-        # Grammar errors are generally warnings
-        if category == 'GRAMMAR':
-            return Severity.WARNING
+        chunk_issues = self._check_impl(chunk, target_lang, context, preset)
+        for issue in chunk_issues:
+            issue.offset_start += start
+            issue.offset_end += start
+        return chunk_issues
+    
+    def _split_into_sentences(self, text: str) -> List[Tuple[int, int]]:
+        """Split text into ordered ``(start, end)`` sentence spans for chunking.
+        
+        Uses blingfire's sentence breaker when installed (it handles
+        abbreviations and ellipses); otherwise falls back to splitting on
+        sentence-ending punctuation.
+        """
+        if BLINGFIRE_AVAILABLE:
+            try:
+                _, offsets = blingfire.text_to_sentences_with_offsets(text)
+                if offsets:
+                    return [(start, end) for start, end in offsets]
+            except Exception as e:
+                logger.debug(f"blingfire sentence splitting failed, using regex fallback: {e}")
         
-        # Style issues are info
-        if category in ['STYLE', 'TYPOGRAPHY', 'REPETITION', 'REDUNDANCY']:
-            return Severity.INFO
+        # Simple sentence splitting on punctuation
+        spans = []
+        start = 0
+        for match in self.SENTENCE_END_PATTERN.finditer(text):
+            # Each sentence keeps its punctuation and trailing whitespace
+            spans.append((start, match.end()))
+            start = match.end()
         
-        # Punctuation is warning
-        if category == 'PUNCTUATION':
-            return Severity.WARNING
+        # Handle case where text doesn't end with punctuation
+        if start < len(text):
+            spans.append((start, len(text)))
         
-        # Capitalization is warning
-        if category == 'CASING':
-            return Severity.WARNING
+        return spans
+    
+    def _convert_matches(
+        self, matches, text: str, target_lang: str, base_offset: int = 0
+    ) -> List[Issue]:
+        """Convert LanguageTool matches to TransQA Issues.
+        
+        ``base_offset`` is where ``text`` starts in the string that was checked.
+        """
+        convert = self._convert_match
+        try:
+            return [convert(match, text, target_lang, base_offset) for match in matches]
+        except Exception:
+            pass
+        
+        # Slow path for malformed responses: convert one by one, skipping bad matches
+        issues = []
+        failed_count = 0
+        for match in matches:
+            try:
+                issues.append(convert(match, text, target_lang, base_offset))
+            except Exception as e:
+                failed_count += 1
+                logger.debug(f"Error converting LanguageTool match: {e}")
+        
+        logger.warning(f"Skipped {failed_count} malformed LanguageTool matches")
+        return issues
+    
+    def _convert_match(self, match, text: str, target_lang: str, base_offset: int = 0) -> Issue:
+        """Convert one LanguageTool match to a TransQA Issue."""
+        # Determine issue type from category
+        category = getattr(match, 'category', 'MISC')
+        issue_type = self.CATEGORY_MAPPING.get(category, IssueType.GRAMMAR)
+        
+        # Get suggestion, position and rule information
+        suggestions = getattr(match, 'replacements', None)
+        offset = getattr(match, 'offset', 0) - base_offset
+        length = self._match_length(match)
+        rule_id = getattr(match, 'ruleId', 'UNKNOWN_RULE')
+        
+        return Issue(
+            type=issue_type,
+            severity=self._determine_severity(match, category, rule_id),
+            message=getattr(match, 'message', 'LanguageTool issue'),
+            suggestion=suggestions[0] if suggestions else None,
+            target_lang=target_lang,
+            snippet=text[offset:offset + length],
+            xpath="/",  # Will be updated by caller if context available
+            offset_start=offset,
+            offset_end=offset + length,
+            rule_id=rule_id,
+            confidence=self._calculate_confidence(match, category)
+        )
+    
+    @staticmethod
+    def _match_length(match) -> int:
+        """Length of the text a match covers."""
+        # language_tool_python exposes this as errorLength
+        length = getattr(match, 'errorLength', None)
+        return length if length is not None else getattr(match, 'length', 1)
+    
+    def _determine_severity(self, match, category: str, rule_id: str) -> Severity:
+        """Determine severity for a LanguageTool match."""
+        severity = self.SEVERITY_BY_CATEGORY.get(category)
+        if severity is not None:
+            return severity
         
         # Default based on LanguageTool's internal priority if available
         priority = getattr(match, 'priority', 0)
@@ -300,13 +642,14 @@ class LanguageToolVerifier(BaseVerifier):
         else:
             return Severity.INFO
     
-    def _calculate_confidence(self, match) -> float:
+    def _calculate_confidence(self, match, category: Optional[str] = None) -> float:
         """Calculate confidence score for a match."""
         # Base confidence
         confidence = 0.8
         
         # Adjust based on category
-        category = getattr(match, 'category', 'MISC')
+        if category is None:
+            category = getattr(match, 'category', 'MISC')
         if category == 'TYPOS':
             confidence = 0.9  # High confidence for spelling
         elif category == 'GRAMMAR':
@@ -328,20 +671,9 @@ class LanguageToolVerifier(BaseVerifier):
             return []
         
         try:
-            # Temporarily disable non-grammar categories
-            tool = self._tools[target_lang]
-            original_disabled = getattr(tool, 'disabled_categories', set())
-            
-            # Disable all categories except grammar
-            tool.disabled_categories = list(original_disabled | {
-                'TYPOS', 'STYLE', 'TYPOGRAPHY', 'REPETITION', 'REDUNDANCY'
-            })
-            
-            issues = self._check_impl(text, target_lang)
-            
-            # Restore original settings
-            tool.disabled_categories = list(original_disabled)
-            
+            # Dedicated tool with the other categories disabled; the shared
+            # tool is never reconfigured, so concurrent checks are unaffected
+            issues = self._check_impl(text, target_lang, preset='grammar')
             return [issue for issue in issues if issue.type == IssueType.GRAMMAR]
         
         except Exception as e:
@@ -354,20 +686,8 @@ class LanguageToolVerifier(BaseVerifier):
             return []
         
         try:
-            # Temporarily enable only spelling
-            tool = self._tools[target_lang]
-            original_disabled = getattr(tool, 'disabled_categories', set())
-            
-            # Disable all categories except spelling
-            tool.disabled_categories = list(original_disabled | {
-                'GRAMMAR', 'STYLE', 'TYPOGRAPHY', 'PUNCTUATION', 'REPETITION', 'REDUNDANCY', 'CASING'
-            })
-            
-            issues = self._check_impl(text, target_lang)
-            
-            # Restore original settings
-            tool.disabled_categories = list(original_disabled)
-            
+            # Only spelling categories enabled
+            issues = self._check_impl(text, target_lang, preset='spelling')
             return [issue for issue in issues if issue.type == IssueType.SPELLING]
         
         except Exception as e:
@@ -380,20 +700,8 @@ class LanguageToolVerifier(BaseVerifier):
             return []
         
         try:
-            # Temporarily enable only style categories
-            tool = self._tools[target_lang]
-            original_disabled = getattr(tool, 'disabled_categories', set())
-            
-            # Disable all categories except style-related
-            tool.disabled_categories = list(original_disabled | {
-                'GRAMMAR', 'TYPOS', 'PUNCTUATION', 'CASING'
-            })
-            
-            issues = self._check_impl(text, target_lang)
-            
-            # Restore original settings
-            tool.disabled_categories = list(original_disabled)
-            
+            # Only style categories enabled
+            issues = self._check_impl(text, target_lang, preset='style')
             return [issue for issue in issues if issue.type == IssueType.STYLE]
         
         except Exception as e: